@@ -0,0 +1,158 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Fourth Estate Policy as Code Framework
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: compliance_history
+short_description: Query the compliance results history database
+description:
+  - Answers historical compliance questions from the I(results_db) written
+    by M(compliance_checker) without re-running checks
+  - Finds controls that regressed, time-to-remediate per control and
+    currently open failures
+version_added: "1.0.0"
+options:
+  results_db:
+    description:
+      - SQLite results database written by M(compliance_checker)
+    required: true
+    type: path
+  query:
+    description:
+      - C(regressions) lists controls that went from passed to failed
+      - C(time_to_remediate) summarizes hours from failure to the run that
+        found each control passing again
+      - C(open_failures) lists controls failing on their latest run
+    required: false
+    type: str
+    default: regressions
+    choices: ['regressions', 'time_to_remediate', 'open_failures']
+  since:
+    description:
+      - Only consider runs started at or after this ISO 8601 date or time
+    required: false
+    type: str
+  days:
+    description:
+      - Only consider runs from the last I(days) days when I(since) is not set
+    required: false
+    type: int
+    default: 7
+  hosts:
+    description:
+      - Restrict the query to these hosts
+    required: false
+    type: list
+    elements: str
+  compliance_frameworks:
+    description:
+      - Restrict the query to controls of these frameworks
+    required: false
+    type: list
+    elements: str
+  limit:
+    description:
+      - Maximum number of rows returned
+    required: false
+    type: int
+    default: 1000
+author:
+  - Fourth Estate Policy Team
+'''
+
+EXAMPLES = r'''
+- name: Controls that regressed since last week
+  compliance_history:
+    results_db: /var/lib/policy_as_code/results.db
+    query: regressions
+    days: 7
+  register: regressions
+
+- name: Time to remediate NIST controls this quarter
+  compliance_history:
+    results_db: /var/lib/policy_as_code/results.db
+    query: time_to_remediate
+    since: '2026-07-01'
+    compliance_frameworks:
+      - nist_800_53
+'''
+
+RETURN = r'''
+since:
+  description: Start of the queried period
+  returned: always
+  type: str
+  sample: '2026-10-12T09:00:00'
+count:
+  description: Number of rows returned
+  returned: always
+  type: int
+  sample: 2
+rows:
+  description: Query results
+  returned: always
+  type: list
+  elements: dict
+  sample:
+    - host: rtr-042
+      framework: nist_800_53
+      control: SC-8
+      severity: critical
+      regressed: '2026-10-15T02:00:00'
+      passing_since: '2026-09-30T02:00:00'
+'''
+
+import os
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.compliance_store import ComplianceStore
+from datetime import datetime, timedelta
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            results_db=dict(type='path', required=True),
+            query=dict(type='str', required=False, default='regressions',
+                       choices=['regressions', 'time_to_remediate', 'open_failures']),
+            since=dict(type='str', required=False),
+            days=dict(type='int', required=False, default=7),
+            hosts=dict(type='list', elements='str', required=False),
+            compliance_frameworks=dict(type='list', elements='str', required=False),
+            limit=dict(type='int', required=False, default=1000)
+        ),
+        supports_check_mode=True
+    )
+
+    results_db = module.params['results_db']
+    if not os.path.exists(results_db):
+        module.fail_json(msg=f"Results database not found: {results_db}")
+
+    if module.params['since']:
+        try:
+            since = datetime.fromisoformat(module.params['since'])
+        except ValueError:
+            module.fail_json(msg=f"since must be an ISO 8601 date or time: {module.params['since']}")
+    else:
+        since = datetime.now() - timedelta(days=module.params['days'])
+    since = since.isoformat(timespec='seconds')
+
+    try:
+        store = ComplianceStore(results_db)
+        try:
+            query = getattr(store, module.params['query'])
+            rows = query(since, hosts=module.params['hosts'],
+                         frameworks=module.params['compliance_frameworks'], limit=module.params['limit'])
+        finally:
+            store.close()
+    except Exception as e:
+        module.fail_json(msg=f"Compliance history query failed: {str(e)}")
+
+    module.exit_json(changed=False, since=since, count=len(rows), rows=rows)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,404 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Fourth Estate Policy as Code Framework
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: compliance_rollup
+short_description: Roll up per-host compliance results into fleet scores
+description:
+  - Aggregates per-host M(compliance_checker) results into fleet-wide scores
+  - Loads control outcomes into a host by control NumPy matrix and computes
+    per-framework, per-control, per-platform and per-severity scores with
+    vectorized operations
+  - Reports the lowest scoring controls and hosts
+version_added: "1.0.0"
+options:
+  results:
+    description:
+      - Registered M(compliance_checker) results run with I(return_outcomes=true)
+      - Each result needs C(target_host), C(platform_type) and C(control_outcomes)
+    required: false
+    type: list
+    elements: dict
+  results_dir:
+    description:
+      - Directory of per-host M(compliance_checker) results saved as C(*.json)
+      - Preferred for large fleets, where passing every result through
+        play variables is slow
+    required: false
+    type: path
+  compliance_frameworks:
+    description:
+      - Only roll up controls of these frameworks
+      - All frameworks found in the results are rolled up when omitted
+    required: false
+    type: list
+    elements: str
+  max_reported:
+    description:
+      - Number of lowest scoring controls and hosts to report
+    required: false
+    type: int
+    default: 25
+requirements:
+  - numpy
+author:
+  - Fourth Estate Policy Team
+'''
+
+EXAMPLES = r'''
+- name: Check compliance with per-control outcomes
+  compliance_checker:
+    target_host: "{{ inventory_hostname }}"
+    platform_type: "{{ platform }}"
+    policies: "{{ all_policies }}"
+    return_outcomes: true
+    check_mode: true
+  register: compliance
+
+- name: Roll up fleet compliance
+  compliance_rollup:
+    results: "{{ ansible_play_hosts | map('extract', hostvars, 'compliance') | list }}"
+  run_once: true
+  register: fleet
+
+- name: Roll up saved results for a large fleet
+  compliance_rollup:
+    results_dir: /var/lib/policy_as_code/results
+    compliance_frameworks:
+      - nist_800_53
+    max_reported: 50
+'''
+
+RETURN = r'''
+fleet:
+  description: Fleet-wide totals and score
+  returned: always
+  type: dict
+  sample:
+    hosts: 52000
+    controls: 980
+    evaluated: 48750000
+    passed: 42412500
+    timed_out: 1200
+    score: 87.0
+    compliant_hosts: 3120
+framework_scores:
+  description: Compliance score (0-100) of each framework across the fleet
+  returned: always
+  type: dict
+  sample:
+    nist_800_53:
+      score: 86.2
+      controls: 640
+      evaluated: 31200000
+      passed: 26894400
+platform_scores:
+  description: Compliance score of each platform type and its compliant hosts
+  returned: always
+  type: dict
+  sample:
+    cisco_ios:
+      score: 84.5
+      hosts: 21000
+      compliant_hosts: 840
+severity_scores:
+  description: Compliance score of controls grouped by severity
+  returned: always
+  type: dict
+  sample:
+    critical:
+      score: 91.3
+      evaluated: 5200000
+      passed: 4747600
+control_scores:
+  description: Lowest scoring controls, up to I(max_reported)
+  returned: always
+  type: list
+  elements: dict
+  sample:
+    - framework: nist_800_53
+      control: SC-8
+      severity: critical
+      score: 62.4
+      evaluated_hosts: 52000
+      failed_hosts: 19552
+      timed_out_hosts: 0
+worst_hosts:
+  description: Lowest scoring hosts, up to I(max_reported)
+  returned: always
+  type: list
+  elements: dict
+  sample:
+    - host: rtr-042
+      platform: cisco_ios
+      score: 41.0
+      failed_controls: 578
+'''
+
+import os
+import traceback
+from array import array
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible.module_utils.checker_results import iter_checker_results
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+    NUMPY_IMPORT_ERROR = None
+except ImportError:
+    HAS_NUMPY = False
+    NUMPY_IMPORT_ERROR = traceback.format_exc()
+
+# Cell values of the host by control outcome matrix
+NOT_EVALUATED = -1
+OUTCOME_CODES = {'failed': 0, 'passed': 1, 'timed_out': 2}
+
+# Severity names by code; a control takes the highest severity reported for it
+SEVERITIES = ('low', 'medium', 'high', 'critical')
+SEVERITY_CODES = {severity: code for code, severity in enumerate(SEVERITIES)}
+
+class ComplianceRollup:
+    """Fleet compliance rollup engine for Fourth Estate"""
+
+    def __init__(self, module):
+        self.module = module
+        self.results = module.params['results']
+        self.results_dir = module.params['results_dir']
+        self.compliance_frameworks = module.params['compliance_frameworks']
+        self.max_reported = module.params['max_reported']
+
+        self.hosts = []
+        self.host_platform = []
+        self.platforms = {}
+        self.controls = {}
+        self.control_keys = []
+        self.control_framework = []
+        self.control_severity = None
+        self.frameworks = {}
+        self.skipped_results = 0
+
+    def rollup(self):
+        """Main fleet rollup workflow"""
+        try:
+            outcomes = self._load_outcomes()
+
+            passed = outcomes == OUTCOME_CODES['passed']
+            evaluated = passed | (outcomes == OUTCOME_CODES['failed'])
+            timed_out = outcomes == OUTCOME_CODES['timed_out']
+            del outcomes
+
+            control_passed = passed.sum(axis=0)
+            control_evaluated = evaluated.sum(axis=0)
+            control_timed_out = timed_out.sum(axis=0)
+            host_passed = passed.sum(axis=1)
+            host_evaluated = evaluated.sum(axis=1)
+            host_timed_out = timed_out.sum(axis=1)
+            del passed, evaluated, timed_out
+
+            host_failed = host_evaluated - host_passed
+            host_compliant = (host_evaluated > 0) & (host_failed == 0) & (host_timed_out == 0)
+            control_framework = np.asarray(self.control_framework, dtype=np.intp)
+            host_platform = np.asarray(self.host_platform, dtype=np.intp)
+
+            result = {
+                'fleet': {
+                    'hosts': len(self.hosts),
+                    'controls': len(self.control_keys),
+                    'evaluated': int(control_evaluated.sum()),
+                    'passed': int(control_passed.sum()),
+                    'timed_out': int(control_timed_out.sum()),
+                    'score': self._score(control_passed.sum(), control_evaluated.sum()),
+                    'compliant_hosts': int(host_compliant.sum())
+                },
+                'framework_scores': self._group_scores(
+                    self.frameworks, control_framework, control_passed, control_evaluated, 'controls'
+                ),
+                'platform_scores': self._platform_scores(host_platform, host_passed, host_evaluated, host_compliant),
+                'severity_scores': self._group_scores(
+                    SEVERITY_CODES, self.control_severity, control_passed, control_evaluated
+                ),
+                'control_scores': self._lowest_controls(control_passed, control_evaluated, control_timed_out),
+                'worst_hosts': self._lowest_hosts(host_passed, host_evaluated, host_failed),
+                'changed': False
+            }
+
+            if self.skipped_results:
+                self.module.warn(
+                    f"Skipped {self.skipped_results} results without control_outcomes; "
+                    "run compliance_checker with return_outcomes=true"
+                )
+            return result
+
+        except Exception as e:
+            self.module.fail_json(msg=f"Compliance rollup failed: {str(e)}")
+
+    def _load_outcomes(self):
+        """Build the host by control int8 outcome matrix"""
+        row_sizes = array('q')
+        cols = array('i')
+        codes = array('b')
+        severities = array('b')
+        frameworks = set(self.compliance_frameworks) if self.compliance_frameworks else None
+        default_severity = SEVERITY_CODES['medium']
+
+        for result in iter_checker_results(self.results, self.results_dir, self.module.warn):
+            control_outcomes = result.get('control_outcomes') if isinstance(result, dict) else None
+            if control_outcomes is None:
+                self.skipped_results += 1
+                continue
+
+            self.hosts.append(result.get('target_host') or f"host-{len(self.hosts)}")
+            platform = result.get('platform_type') or 'unknown'
+            self.host_platform.append(self.platforms.setdefault(platform, len(self.platforms)))
+
+            # Hosts share a control layout, so lookups hit known columns after the first host
+            columns = self.controls.get
+            row_cols = [columns((item.get('framework'), item.get('control'))) for item in control_outcomes]
+            if None in row_cols:
+                row_cols = [
+                    self._add_control(item, frameworks) if col is None else col
+                    for col, item in zip(row_cols, control_outcomes)
+                ]
+            row_sizes.append(len(row_cols))
+            cols.extend(row_cols)
+            codes.extend([OUTCOME_CODES.get(item.get('outcome'), NOT_EVALUATED) for item in control_outcomes])
+            severities.extend([SEVERITY_CODES.get(item.get('severity'), default_severity) for item in control_outcomes])
+
+        col_index = np.frombuffer(cols, dtype=np.int32) if cols else np.zeros(0, dtype=np.int32)
+        row_index = np.repeat(np.arange(len(self.hosts)), np.frombuffer(row_sizes, dtype=np.int64)) \
+            if row_sizes else np.zeros(0, dtype=np.intp)
+        in_scope = col_index >= 0
+
+        # A control takes the highest severity reported for it by any host
+        self.control_severity = np.zeros(len(self.control_keys), dtype=np.intp)
+        if codes:
+            np.maximum.at(self.control_severity, col_index[in_scope],
+                          np.frombuffer(severities, dtype=np.int8)[in_scope])
+
+        outcomes = np.full((len(self.hosts), len(self.control_keys)), NOT_EVALUATED, dtype=np.int8)
+        if codes:
+            outcomes[row_index[in_scope], col_index[in_scope]] = np.frombuffer(codes, dtype=np.int8)[in_scope]
+        return outcomes
+
+    def _add_control(self, item, frameworks):
+        """Assign a matrix column to a new control, or -1 when its framework is filtered out"""
+        framework = item.get('framework')
+        key = (framework, item.get('control'))
+        if frameworks is not None and framework not in frameworks:
+            self.controls[key] = -1
+            return -1
+        col = self.controls[key] = len(self.control_keys)
+        self.control_keys.append(key)
+        self.control_framework.append(self.frameworks.setdefault(framework, len(self.frameworks)))
+        return col
+
+    def _score(self, passed, evaluated):
+        """Percentage score, 0.0 when nothing was evaluated"""
+        return round(float(passed) / float(evaluated) * 100, 2) if evaluated else 0.0
+
+    def _group_scores(self, names, groups, control_passed, control_evaluated, count_key=None):
+        """Scores of controls grouped by a per-control group code"""
+        size = len(names)
+        passed = np.bincount(groups, weights=control_passed, minlength=size)
+        evaluated = np.bincount(groups, weights=control_evaluated, minlength=size)
+        counts = np.bincount(groups, minlength=size)
+
+        scores = {}
+        for name, code in names.items():
+            if not counts[code]:
+                continue
+            scores[name] = {
+                'score': self._score(passed[code], evaluated[code]),
+                'evaluated': int(evaluated[code]),
+                'passed': int(passed[code])
+            }
+            if count_key:
+                scores[name][count_key] = int(counts[code])
+        return scores
+
+    def _platform_scores(self, host_platform, host_passed, host_evaluated, host_compliant):
+        """Scores and compliant host counts per platform type"""
+        size = len(self.platforms)
+        passed = np.bincount(host_platform, weights=host_passed, minlength=size)
+        evaluated = np.bincount(host_platform, weights=host_evaluated, minlength=size)
+        compliant = np.bincount(host_platform, weights=host_compliant, minlength=size)
+        hosts = np.bincount(host_platform, minlength=size)
+
+        return {
+            platform: {
+                'score': self._score(passed[code], evaluated[code]),
+                'hosts': int(hosts[code]),
+                'compliant_hosts': int(compliant[code])
+            }
+            for platform, code in self.platforms.items()
+        }
+
+    def _lowest(self, passed, evaluated):
+        """Indexes of the lowest scores among evaluated entries"""
+        scores = np.divide(passed, evaluated, out=np.ones(len(passed)), where=evaluated > 0)
+        candidates = np.flatnonzero(evaluated > 0)
+        order = candidates[np.argsort(scores[candidates], kind='stable')]
+        return order[:self.max_reported]
+
+    def _lowest_controls(self, control_passed, control_evaluated, control_timed_out):
+        """Lowest scoring controls across the fleet"""
+        lowest = []
+        for col in self._lowest(control_passed, control_evaluated):
+            framework, control = self.control_keys[col]
+            lowest.append({
+                'framework': framework,
+                'control': control,
+                'severity': SEVERITIES[self.control_severity[col]],
+                'score': self._score(control_passed[col], control_evaluated[col]),
+                'evaluated_hosts': int(control_evaluated[col]),
+                'failed_hosts': int(control_evaluated[col] - control_passed[col]),
+                'timed_out_hosts': int(control_timed_out[col])
+            })
+        return lowest
+
+    def _lowest_hosts(self, host_passed, host_evaluated, host_failed):
+        """Lowest scoring hosts in the fleet"""
+        platforms = list(self.platforms)
+        return [
+            {
+                'host': self.hosts[row],
+                'platform': platforms[self.host_platform[row]],
+                'score': self._score(host_passed[row], host_evaluated[row]),
+                'failed_controls': int(host_failed[row])
+            }
+            for row in self._lowest(host_passed, host_evaluated)
+        ]
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            results=dict(type='list', elements='dict', required=False),
+            results_dir=dict(type='path', required=False),
+            compliance_frameworks=dict(type='list', elements='str', required=False),
+            max_reported=dict(type='int', required=False, default=25)
+        ),
+        mutually_exclusive=[('results', 'results_dir')],
+        required_one_of=[('results', 'results_dir')],
+        supports_check_mode=True
+    )
+
+    if not HAS_NUMPY:
+        module.fail_json(msg=missing_required_lib('numpy'), exception=NUMPY_IMPORT_ERROR)
+
+    if module.params['results_dir'] and not os.path.isdir(module.params['results_dir']):
+        module.fail_json(msg=f"results_dir {module.params['results_dir']} is not a directory")
+    if module.params['max_reported'] < 0:
+        module.fail_json(msg="max_reported must be 0 or greater")
+
+    rollup = ComplianceRollup(module)
+    module.exit_json(**rollup.rollup())
+
+if __name__ == '__main__':
+    main()
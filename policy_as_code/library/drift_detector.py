@@ -32,8 +32,26 @@ options:
   baseline_file:
     description:
       - Path to baseline configuration or policy file
+      - Files without a C(.yml), C(.yaml) or C(.json) extension are parsed as a
+        golden running-config using I(config_dialect)
     required: true
     type: path
+  running_config:
+    description:
+      - Path to a captured running-config (for example a nightly backup)
+      - When set, the current configuration is parsed from this file instead
+        of being retrieved from the target host
+      - The file is read through a memory-mapped buffer, so multi-megabyte
+        configurations are parsed at low memory
+    required: false
+    type: path
+  config_dialect:
+    description:
+      - Running-config dialect used for I(running_config) and raw baselines
+      - Defaults to the dialect mapped from I(platform_type)
+    required: false
+    type: str
+    choices: ['ios', 'nxos', 'eos']
   drift_threshold:
     description:
       - Drift threshold percentage (0-100) before alerting
@@ -58,6 +76,26 @@ options:
     required: false
     type: path
     default: '/var/lib/policy_as_code/drift'
+  result_mode:
+    description:
+      - C(full) returns every drifted parameter
+      - C(diff) returns only drift that is new, changed or resolved since the
+        host's previous run, recorded in I(drift_history_dir), with stable
+        C(finding_id)s and a count of unchanged drift; I(critical_drift)
+        is then omitted in favour of I(critical_drift_count)
+    required: false
+    type: str
+    default: full
+    choices: ['full', 'diff']
+  findings_dir:
+    description:
+      - Stream drift to C(<target_host>_drift.jsonl) in this directory as it
+        is found instead of holding it in memory
+      - The result then carries counts, the drift percentage and
+        C(findings_file) in place of I(drift_details) and I(critical_drift);
+        cannot be combined with I(result_mode=diff)
+    required: false
+    type: path
 author:
   - Fourth Estate Policy Team
 '''
@@ -86,6 +124,13 @@ EXAMPLES = r'''
     drift_threshold: 0.0
     alert_on_drift: true
   loop: "{{ groups['critical_infrastructure'] }}"
+
+- name: Detect drift directly on a running-config backup
+  drift_detector:
+    target_host: "{{ inventory_hostname }}"
+    platform_type: cisco_nxos
+    baseline_file: /etc/policies/baselines/nxos_golden.cfg
+    running_config: "/var/backups/network/{{ inventory_hostname }}.cfg"
 '''
 
 RETURN = r'''
@@ -111,7 +156,7 @@ drifted_parameters:
   sample: 12
 drift_details:
   description: Details of each drift
-  returned: when drift detected
+  returned: when drift detected, result_mode is full and findings_dir is not set
   type: list
   elements: dict
   sample:
@@ -127,9 +172,41 @@ drift_details:
       actual: 3600
       severity: 'medium'
       category: 'access_control'
+    - parameter: 'line vty 0 4 > exec-timeout 15 0'
+      expected: true
+      actual: null
+      severity: 'medium'
+      category: 'general'
+drift_changes:
+  description: Drift new, changed or resolved since the previous run and the number left unchanged
+  returned: when result_mode is diff
+  type: dict
+  sample:
+    new:
+      - finding_id: 0c4d8e2f9a6b1735
+        parameter: 'ssl.minimum_version'
+        expected: 'TLSv1.2'
+        actual: 'TLSv1.0'
+        severity: 'high'
+        category: 'security'
+    changed: []
+    resolved:
+      - finding_id: 5b7e1d9c3a2f0846
+        parameter: 'session.timeout'
+    unchanged: 2
+findings_file:
+  description: JSONL file holding one drifted parameter per line
+  returned: when findings_dir is set
+  type: str
+  sample: /var/lib/policy_as_code/findings/rtr-042_drift.jsonl
+critical_drift_count:
+  description: Number of critical severity drift items
+  returned: always
+  type: int
+  sample: 1
 critical_drift:
   description: List of critical severity drift
-  returned: when critical drift detected
+  returned: when critical drift detected, result_mode is full and findings_dir is not set
   type: list
   elements: dict
 drift_trend:
@@ -153,13 +230,146 @@ recommendations:
 '''
 
 import json
+import mmap
 import os
 import yaml
 import hashlib
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.compliance_records import DriftItem
+from ansible.module_utils.finding_diff import FindingLedger
+from ansible.module_utils.findings_writer import FindingsWriter
 from datetime import datetime, timedelta
 from collections import defaultdict
 
+# Running-config dialects for indentation-hierarchical device configurations.
+# Lines matching comment_prefixes or ignore_lines carry no configuration state.
+CONFIG_DIALECTS = {
+    'ios': {
+        'comment_prefixes': (b'!',),
+        'ignore_prefixes': (b'Building configuration', b'Current configuration'),
+        'ignore_lines': (b'end', b'exit-address-family', b'exit-peer-policy', b'exit-peer-session'),
+        'negation': 'no ',
+        'banner_prefix': b'banner ',
+    },
+    'nxos': {
+        'comment_prefixes': (b'!',),
+        'ignore_prefixes': (),
+        'ignore_lines': (),
+        'negation': 'no ',
+        'banner_prefix': b'banner ',
+    },
+    'eos': {
+        'comment_prefixes': (b'!',),
+        'ignore_prefixes': (),
+        'ignore_lines': (b'end', b'exit'),
+        'negation': 'no ',
+        'banner_prefix': b'banner ',
+    },
+}
+
+PLATFORM_DIALECTS = {
+    'cisco_ios': 'ios',
+    'cisco_iosxe': 'ios',
+    'cisco_iosxr': 'ios',
+    'cisco_nxos': 'nxos',
+    'arista_eos': 'eos',
+    'arista': 'eos',
+}
+
+# Separator between section and command in flattened parameter names
+PARAMETER_SEPARATOR = ' > '
+
+BASELINE_POLICY_EXTENSIONS = ('.yml', '.yaml', '.json')
+
+class RunningConfigParser:
+    """Streaming parser for indentation-hierarchical running-configs"""
+
+    def __init__(self, dialect):
+        self.dialect = CONFIG_DIALECTS[dialect]
+
+    def parse_file(self, path):
+        """Parse a running-config file into a nested command tree"""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return {}
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                return self._build_tree(self._iter_lines(buf))
+
+    def _iter_lines(self, buf):
+        """Yield (indent, command) for each configuration line in the buffer"""
+        comment_prefixes = self.dialect['comment_prefixes']
+        ignore_prefixes = self.dialect['ignore_prefixes']
+        ignore_lines = self.dialect['ignore_lines']
+        banner_prefix = self.dialect['banner_prefix']
+        banner_delimiter = None
+        pos = 0
+        size = len(buf)
+
+        while pos < size:
+            eol = buf.find(b'\n', pos)
+            if eol == -1:
+                eol = size
+            line = buf[pos:eol].rstrip()
+            pos = eol + 1
+
+            # Skip banner bodies up to the closing delimiter
+            if banner_delimiter is not None:
+                if banner_delimiter in line:
+                    banner_delimiter = None
+                continue
+
+            command = line.lstrip()
+            if not command or command.startswith(comment_prefixes):
+                continue
+            if command in ignore_lines or (ignore_prefixes and command.startswith(ignore_prefixes)):
+                continue
+
+            indent = len(line) - len(command)
+
+            if command.startswith(banner_prefix):
+                parts = command.split(None, 2)
+                if len(parts) == 3:
+                    body = parts[2]
+                    delimiter = body[:2] if body.startswith(b'^C') else body[:1]
+                    if delimiter not in body[len(delimiter):]:
+                        banner_delimiter = delimiter
+                    command = b' '.join(parts[:2])
+
+            yield indent, command.decode('utf-8', 'replace')
+
+    def _build_tree(self, lines):
+        """Nest commands under their parent section by indentation"""
+        tree = {}
+        stack = [(-1, tree)]
+        for indent, command in lines:
+            while stack[-1][0] >= indent:
+                stack.pop()
+            children = stack[-1][1].setdefault(command, {})
+            stack.append((indent, children))
+        return tree
+
+    def to_parameters(self, tree):
+        """Flatten a command tree into drift parameters
+
+        Each command becomes a parameter named by its section path. Present
+        commands have the value True; negated commands ('no ...') are stored
+        under the positive command with the value False.
+        """
+        negation = self.dialect['negation']
+        parameters = {}
+        pending = [((), tree)]
+        while pending:
+            path, node = pending.pop()
+            for command, children in node.items():
+                if command.startswith(negation):
+                    name, value = command[len(negation):], False
+                else:
+                    name, value = command, True
+                parameters[PARAMETER_SEPARATOR.join(path + (name,))] = value
+                if children:
+                    pending.append((path + (command,), children))
+        return parameters
+
 class DriftDetector:
     """Configuration drift detection engine"""
 
@@ -172,9 +382,19 @@ class DriftDetector:
         self.check_interval = module.params['check_interval']
         self.alert_on_drift = module.params['alert_on_drift']
         self.drift_history_dir = module.params['drift_history_dir']
+        self.running_config = module.params['running_config']
+        self.config_dialect = module.params['config_dialect']
+        self.result_mode = module.params['result_mode']
+        self.findings_dir = module.params['findings_dir']
 
+        self.detected_at = datetime.now().isoformat()
         self.drift_details = []
         self.critical_drift = []
+        self.drift_count = 0
+        self.critical_count = 0
+        self.severity_counts = defaultdict(int)
+        self.category_counts = defaultdict(int)
+        self.findings_writer = None
 
     def detect_drift(self):
         """Main drift detection workflow"""
@@ -186,11 +406,17 @@ class DriftDetector:
             current_config = self._get_current_config()
 
             # Compare configurations
+            if self.findings_dir:
+                self.findings_writer = FindingsWriter(
+                    os.path.join(self.findings_dir, f"{self.target_host}_drift.jsonl")
+                )
             self._compare_configurations(baseline, current_config)
+            if self.findings_writer is not None:
+                self.findings_writer.close()
 
             # Calculate drift percentage
             total_params = len(baseline.get('parameters', {}))
-            drifted_params = len(self.drift_details)
+            drifted_params = self.drift_count
             drift_percentage = (drifted_params / total_params * 100) if total_params > 0 else 0.0
 
             # Check against threshold
@@ -210,19 +436,31 @@ class DriftDetector:
             if drift_detected and self.alert_on_drift:
                 self._send_alerts()
 
-            return {
+            result = {
                 'drift_detected': drift_detected,
                 'drift_percentage': round(drift_percentage, 2),
                 'total_parameters': total_params,
                 'drifted_parameters': drifted_params,
-                'drift_details': self.drift_details,
-                'critical_drift': self.critical_drift,
+                'drift_details': [drift.to_dict() for drift in self.drift_details],
+                'critical_drift': [drift.to_dict() for drift in self.critical_drift],
+                'critical_drift_count': self.critical_count,
                 'drift_trend': drift_trend,
                 'recommendations': recommendations,
                 'changed': False
             }
+            if self.result_mode == 'diff':
+                result['drift_changes'] = self._diff_drift(result.pop('drift_details'))
+                # Critical drift is a subset of the diffed drift; only its count is kept
+                del result['critical_drift']
+            if self.findings_writer is not None:
+                result['findings_file'] = self.findings_writer.path
+                del result['drift_details']
+                del result['critical_drift']
+            return result
 
         except Exception as e:
+            if self.findings_writer is not None:
+                self.findings_writer.abort()
             self.module.fail_json(msg=f"Drift detection failed: {str(e)}")
 
     def _load_baseline(self):
@@ -231,13 +469,44 @@ class DriftDetector:
             self.module.fail_json(msg=f"Baseline file not found: {self.baseline_file}")
 
         try:
+            if not self.baseline_file.lower().endswith(BASELINE_POLICY_EXTENSIONS):
+                return {'parameters': self._parse_running_config(self.baseline_file)}
+
             with open(self.baseline_file, 'r') as f:
                 return yaml.safe_load(f)
         except Exception as e:
             self.module.fail_json(msg=f"Failed to parse baseline file: {str(e)}")
 
+    def _get_config_parser(self):
+        """Get the running-config parser for the configured dialect"""
+        dialect = self.config_dialect or PLATFORM_DIALECTS.get(self.platform_type)
+        if dialect is None:
+            self.module.fail_json(
+                msg=f"No running-config dialect known for platform {self.platform_type} - set config_dialect"
+            )
+        return RunningConfigParser(dialect)
+
+    def _parse_running_config(self, path):
+        """Parse a running-config file into drift parameters"""
+        parser = self._get_config_parser()
+        return parser.to_parameters(parser.parse_file(path))
+
     def _get_current_config(self):
         """Get current configuration from target host"""
+        if self.running_config:
+            if not os.path.exists(self.running_config):
+                self.module.fail_json(msg=f"Running-config file not found: {self.running_config}")
+
+            return {
+                'parameters': self._parse_running_config(self.running_config),
+                'metadata': {
+                    'retrieved_at': datetime.now().isoformat(),
+                    'host': self.target_host,
+                    'platform': self.platform_type,
+                    'source': self.running_config
+                }
+            }
+
         # In real implementation, this would:
         # 1. Connect to target host
         # 2. Retrieve current configuration
@@ -276,33 +545,44 @@ class DriftDetector:
             category = param_metadata.get('category', 'general')
 
             if actual_value != expected_value:
-                drift = {
-                    'parameter': param,
-                    'expected': expected_value,
-                    'actual': actual_value,
-                    'severity': severity,
-                    'category': category,
-                    'detected_at': datetime.now().isoformat()
-                }
-
-                self.drift_details.append(drift)
-
-                if severity == 'critical':
-                    self.critical_drift.append(drift)
+                drift = DriftItem(
+                    parameter=param,
+                    expected=expected_value,
+                    actual=actual_value,
+                    severity=severity,
+                    category=category,
+                    detected_at=self.detected_at
+                )
+                self._add_drift(drift)
 
         # Check for parameters in current but not in baseline (unauthorized additions)
         for param in current_params:
             if param not in baseline_params:
-                drift = {
-                    'parameter': param,
-                    'expected': None,
-                    'actual': current_params[param],
-                    'severity': 'medium',
-                    'category': 'unauthorized_change',
-                    'detected_at': datetime.now().isoformat(),
-                    'note': 'Parameter not in baseline - potential unauthorized change'
-                }
-                self.drift_details.append(drift)
+                drift = DriftItem(
+                    parameter=param,
+                    expected=None,
+                    actual=current_params[param],
+                    severity='medium',
+                    category='unauthorized_change',
+                    detected_at=self.detected_at,
+                    note='Parameter not in baseline - potential unauthorized change'
+                )
+                self._add_drift(drift)
+
+    def _add_drift(self, drift):
+        """Count a drift item and keep it, or stream it out when spilling to disk"""
+        self.drift_count += 1
+        self.severity_counts[drift.severity] += 1
+        self.category_counts[drift.category] += 1
+        if drift.severity == 'critical':
+            self.critical_count += 1
+
+        if self.findings_writer is not None:
+            self.findings_writer.write(drift.to_dict())
+            return
+        self.drift_details.append(drift)
+        if drift.severity == 'critical':
+            self.critical_drift.append(drift)
 
     def _get_drift_trend(self, current_drift):
         """Get drift trend from historical data"""
@@ -375,16 +655,23 @@ class DriftDetector:
         entry = {
             'timestamp': datetime.now().isoformat(),
             'drift_percentage': drift_percentage,
-            'drifted_parameters': len(drift_details),
-            'critical_drift_count': len(self.critical_drift),
+            'drifted_parameters': self.drift_count,
+            'critical_drift_count': self.critical_count,
             'drift_summary': [
                 {
-                    'parameter': d['parameter'],
-                    'severity': d['severity']
+                    'parameter': d.parameter,
+                    'severity': d.severity
                 }
                 for d in drift_details
             ]
         }
+        if self.findings_writer is not None:
+            # Spilled drift is not held in memory; summarize it by severity and category
+            entry['findings_file'] = self.findings_writer.path
+            entry['drift_summary'] = {
+                'severity': {severity: count for severity, count in self.severity_counts.items() if count},
+                'category': {category: count for category, count in self.category_counts.items() if count}
+            }
         history.append(entry)
 
         # Keep only last 90 days of history
@@ -401,6 +688,24 @@ class DriftDetector:
         except Exception as e:
             self.module.warn(f"Failed to save drift history: {str(e)}")
 
+    def _diff_drift(self, drift_details):
+        """Diff drift against the drift recorded by the host's previous run"""
+        ledger = FindingLedger(
+            os.path.join(self.drift_history_dir, f"{self.target_host}_drift_findings.json"),
+            self.target_host, identity=('parameter',), volatile=('detected_at',)
+        )
+        try:
+            ledger.load()
+        except Exception as e:
+            self.module.warn(f"Failed to read previous drift, reporting all as new: {str(e)}")
+
+        changes = ledger.diff(drift_details)
+        try:
+            ledger.save()
+        except Exception as e:
+            self.module.warn(f"Failed to save drift findings: {str(e)}")
+        return changes
+
     def _generate_recommendations(self, drift_detected, drift_percentage):
         """Generate remediation recommendations"""
         recommendations = []
@@ -410,16 +715,14 @@ class DriftDetector:
             return recommendations
 
         # Critical drift recommendations
-        if self.critical_drift:
+        if self.critical_count:
             recommendations.append(
-                f"URGENT: {len(self.critical_drift)} critical severity drift items detected - "
+                f"URGENT: {self.critical_count} critical severity drift items detected - "
                 f"immediate remediation required"
             )
 
         # Severity-based recommendations
-        severity_counts = defaultdict(int)
-        for drift in self.drift_details:
-            severity_counts[drift['severity']] += 1
+        severity_counts = self.severity_counts
 
         if severity_counts['high'] > 0:
             recommendations.append(
@@ -444,9 +747,7 @@ class DriftDetector:
             )
 
         # Category-based recommendations
-        category_counts = defaultdict(int)
-        for drift in self.drift_details:
-            category_counts[drift['category']] += 1
+        category_counts = self.category_counts
 
         if category_counts['security'] > 0:
             recommendations.append(
@@ -477,8 +778,8 @@ class DriftDetector:
 
         alert_data = {
             'host': self.target_host,
-            'drift_percentage': self.drift_details,
-            'critical_drift_count': len(self.critical_drift),
+            'drift_percentage': [drift.to_dict() for drift in self.drift_details],
+            'critical_drift_count': self.critical_count,
             'timestamp': datetime.now().isoformat()
         }
 
@@ -494,15 +795,22 @@ def main():
             check_interval=dict(type='int', required=False, default=24),
             alert_on_drift=dict(type='bool', required=False, default=True),
             drift_history_dir=dict(type='path', required=False,
-                                  default='/var/lib/policy_as_code/drift')
+                                  default='/var/lib/policy_as_code/drift'),
+            running_config=dict(type='path', required=False),
+            config_dialect=dict(type='str', required=False, choices=['ios', 'nxos', 'eos']),
+            result_mode=dict(type='str', required=False, default='full', choices=['full', 'diff']),
+            findings_dir=dict(type='path', required=False)
         ),
         supports_check_mode=True
     )
 
+    if module.params['findings_dir'] and module.params['result_mode'] == 'diff':
+        module.fail_json(msg="findings_dir cannot be combined with result_mode=diff")
+
     detector = DriftDetector(module)
     result = detector.detect_drift()
 
-    if result['drift_detected'] and len(result.get('critical_drift', [])) > 0:
+    if result['drift_detected'] and result['critical_drift_count'] > 0:
         # Report critical drift but don't fail (allow playbook to continue)
         module.warn(f"Critical drift detected on {module.params['target_host']}")
 
@@ -0,0 +1,275 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Fourth Estate Policy as Code Framework
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: oscal_exporter
+short_description: Export compliance results as OSCAL assessment-results
+description:
+  - Streams M(compliance_checker) control outcomes, or the latest outcomes
+    held by its I(results_db), into an OSCAL assessment-results JSON document
+  - Every control outcome of every host becomes an observation of that
+    host; passed and failed outcomes also become a finding targeting the
+    control, C(satisfied) or C(not-satisfied)
+  - The document is written incrementally and never built in memory, so
+    fleet packages with millions of observations export in memory bounded
+    by the number of hosts
+version_added: "1.0.0"
+options:
+  results:
+    description:
+      - Registered M(compliance_checker) results run with I(return_outcomes=true)
+      - Each result needs C(target_host), C(platform_type) and C(control_outcomes)
+    required: false
+    type: list
+    elements: dict
+  results_dir:
+    description:
+      - Directory of per-host M(compliance_checker) results saved as C(*.json)
+    required: false
+    type: path
+  results_db:
+    description:
+      - SQLite results database written by M(compliance_checker); the latest
+        outcome of each control of each host is exported
+    required: false
+    type: path
+  output:
+    description:
+      - OSCAL assessment-results JSON file to write
+    required: true
+    type: path
+  hosts:
+    description:
+      - Only export these hosts
+    required: false
+    type: list
+    elements: str
+  compliance_frameworks:
+    description:
+      - Only export controls of these frameworks
+    required: false
+    type: list
+    elements: str
+  include_passed:
+    description:
+      - Export passed controls; when false only failed and timed out
+        controls are exported
+    required: false
+    type: bool
+    default: true
+  title:
+    description:
+      - Title of the assessment-results document and its result
+    required: false
+    type: str
+    default: 'Fourth Estate Policy as Code Assessment Results'
+  document_version:
+    description:
+      - Version recorded in the document metadata
+    required: false
+    type: str
+    default: '1.0'
+  assessment_plan:
+    description:
+      - Reference to the OSCAL assessment plan the results import
+    required: false
+    type: str
+    default: 'assessment-plan.json'
+notes:
+  - NIST 800-53 controls are targeted by their OSCAL control ID (C(AC-2(1))
+    becomes C(ac-2.1)); other framework identifiers are used as they are.
+  - Outcomes read from checker results are collected at export time;
+    outcomes read from I(results_db) carry the start of the run that last
+    checked them.
+author:
+  - Fourth Estate Policy Team
+'''
+
+EXAMPLES = r'''
+- name: Export this play's compliance results
+  oscal_exporter:
+    results: "{{ ansible_play_hosts | map('extract', hostvars, 'compliance') | list }}"
+    output: /var/lib/policy_as_code/oscal/assessment-results.json
+  run_once: true
+
+- name: Export the fleet's latest NIST outcomes from the results database
+  oscal_exporter:
+    results_db: /var/lib/policy_as_code/results.db
+    compliance_frameworks:
+      - nist_800_53
+    assessment_plan: https://grc.example.com/oscal/assessment-plan.json
+    output: /var/lib/policy_as_code/oscal/fleet-assessment-results.json
+'''
+
+RETURN = r'''
+output:
+  description: Path of the written assessment-results document
+  returned: unless in check mode
+  type: str
+  sample: /var/lib/policy_as_code/oscal/assessment-results.json
+hosts:
+  description: Number of hosts exported as inventory items
+  returned: always
+  type: int
+  sample: 52000
+observations:
+  description: Number of observations written
+  returned: always
+  type: int
+  sample: 48751200
+findings:
+  description: Number of findings written, by target status
+  returned: always
+  type: dict
+  sample:
+    total: 48750000
+    satisfied: 42412500
+    not-satisfied: 6337500
+skipped_results:
+  description: Number of checker results without control outcomes
+  returned: always
+  type: int
+  sample: 0
+'''
+
+import itertools
+import os
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.checker_results import iter_checker_results
+from ansible.module_utils.compliance_store import ComplianceStore
+from ansible.module_utils.oscal_writer import AssessmentResultsWriter, oscal_timestamp
+
+class OscalExporter:
+    """Streams compliance outcomes into an OSCAL assessment-results document"""
+
+    def __init__(self, module):
+        self.module = module
+        self.results = module.params['results']
+        self.results_dir = module.params['results_dir']
+        self.results_db = module.params['results_db']
+        self.output = module.params['output']
+        self.hosts = set(module.params['hosts']) if module.params['hosts'] else None
+        self.frameworks = set(module.params['compliance_frameworks']) \
+            if module.params['compliance_frameworks'] else None
+        self.include_passed = module.params['include_passed']
+        self.skipped_results = 0
+
+    def export(self):
+        """Main export workflow"""
+        try:
+            writer = AssessmentResultsWriter(
+                self.output,
+                self.module.params['title'],
+                self.module.params['document_version'],
+                self.module.params['assessment_plan'],
+                'Automated policy as code compliance checks of each host against its mapped framework controls'
+            )
+        except OSError as e:
+            self.module.fail_json(msg=f"Failed to create {self.output}: {str(e)}")
+
+        try:
+            for outcome in self._iter_outcomes():
+                if outcome.get('outcome') == 'passed' and not self.include_passed:
+                    continue
+                writer.observe(outcome['host'], outcome['platform'], outcome['framework'], outcome['control'],
+                               outcome.get('outcome'), outcome.get('severity'), outcome['collected'])
+            if self.module.check_mode:
+                writer.abort()
+            else:
+                writer.close()
+        except Exception as e:
+            writer.abort()
+            self.module.fail_json(msg=f"OSCAL export failed: {str(e)}")
+
+        if self.skipped_results:
+            self.module.warn(
+                f"Skipped {self.skipped_results} results without control_outcomes; "
+                "run compliance_checker with return_outcomes=true"
+            )
+
+        result = {
+            'changed': True,
+            'hosts': len(writer.subjects),
+            'observations': writer.observations,
+            'findings': dict(writer.states, total=writer.findings),
+            'skipped_results': self.skipped_results
+        }
+        if not self.module.check_mode:
+            result['output'] = self.output
+        return result
+
+    def _iter_outcomes(self):
+        """Yield control outcomes with their host, platform and collection time"""
+        if self.results_db:
+            yield from self._iter_stored_outcomes()
+            return
+
+        collected = oscal_timestamp()
+        for result in iter_checker_results(self.results, self.results_dir, self.module.warn):
+            control_outcomes = result.get('control_outcomes') if isinstance(result, dict) else None
+            if control_outcomes is None:
+                self.skipped_results += 1
+                continue
+
+            host = result.get('target_host') or 'unknown'
+            if self.hosts is not None and host not in self.hosts:
+                continue
+            platform = result.get('platform_type')
+            for item in control_outcomes:
+                if self.frameworks is not None and item.get('framework') not in self.frameworks:
+                    continue
+                yield dict(item, host=host, platform=platform, collected=collected)
+
+    def _iter_stored_outcomes(self):
+        """Yield the latest outcomes recorded in the results database, one host at a time"""
+        store = ComplianceStore(self.results_db)
+        try:
+            rows = store.latest_outcomes(
+                hosts=sorted(self.hosts) if self.hosts else None,
+                frameworks=sorted(self.frameworks) if self.frameworks else None
+            )
+            for _, host_rows in itertools.groupby(rows, key=lambda row: row['host']):
+                collected = {}
+                for row in host_rows:
+                    if row['last_checked'] not in collected:
+                        collected[row['last_checked']] = oscal_timestamp(row['last_checked'])
+                    yield dict(row, collected=collected[row['last_checked']])
+        finally:
+            store.close()
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            results=dict(type='list', elements='dict', required=False),
+            results_dir=dict(type='path', required=False),
+            results_db=dict(type='path', required=False),
+            output=dict(type='path', required=True),
+            hosts=dict(type='list', elements='str', required=False),
+            compliance_frameworks=dict(type='list', elements='str', required=False),
+            include_passed=dict(type='bool', required=False, default=True),
+            title=dict(type='str', required=False, default='Fourth Estate Policy as Code Assessment Results'),
+            document_version=dict(type='str', required=False, default='1.0'),
+            assessment_plan=dict(type='str', required=False, default='assessment-plan.json')
+        ),
+        mutually_exclusive=[('results', 'results_dir', 'results_db')],
+        required_one_of=[('results', 'results_dir', 'results_db')],
+        supports_check_mode=True
+    )
+
+    if module.params['results_dir'] and not os.path.isdir(module.params['results_dir']):
+        module.fail_json(msg=f"results_dir {module.params['results_dir']} is not a directory")
+    if module.params['results_db'] and not os.path.exists(module.params['results_db']):
+        module.fail_json(msg=f"Results database not found: {module.params['results_db']}")
+
+    exporter = OscalExporter(module)
+    module.exit_json(**exporter.export())
+
+if __name__ == '__main__':
+    main()
@@ -17,6 +17,9 @@ description:
   - Performs pre-enforcement validation
   - Creates backups before enforcement
   - Supports rollback on failure
+  - A dry run reads each host's current values once and writes a per-host
+    plan of only the actions whose value differs; apply executes that plan,
+    so compliant hosts are not touched
 version_added: "1.0.0"
 options:
   policy_file:
@@ -66,6 +69,43 @@ options:
     required: false
     type: bool
     default: true
+  validation_cache_dir:
+    description:
+      - Directory of stored pre-enforcement validation results, keyed by a
+        hash of the policy file content and the validation rules version
+      - Set to an empty string to disable the cache
+    required: false
+    type: path
+    default: '/var/lib/policy_as_code/validation_cache'
+  plan_dir:
+    description:
+      - Directory of per-host enforcement plans, named
+        C(<host>_<platform_type>_<policy>_plan.json) where C(<policy>) is the
+        policy file name and a short hash of its path, so plans of different
+        policies for the same host never overwrite each other
+      - I(enforce_mode=dry_run) writes each host's plan with the current
+        value of every differing action; check mode never writes plans
+      - I(enforce_mode=apply) executes a host's plan instead of reading the
+        host again, and removes it once applied; hosts without a plan are
+        read and planned first
+      - Set to an empty string to disable plan files
+    required: false
+    type: path
+    default: '/var/lib/policy_as_code/plans'
+  plan_max_age:
+    description:
+      - Maximum age of a plan before apply rejects it as stale (in hours)
+      - A plan is also stale once the policy file content changes
+    required: false
+    type: int
+    default: 24
+  require_plan:
+    description:
+      - Fail hosts that have no plan in I(plan_dir) instead of planning them
+        during apply
+    required: false
+    type: bool
+    default: false
 author:
   - Fourth Estate Policy Team
 '''
@@ -89,6 +129,15 @@ EXAMPLES = r'''
     backup: true
     rollback_on_failure: true
 
+- name: Plan the security baseline, review it, then apply only the planned changes
+  policy_enforcer:
+    policy_file: /etc/policies/security_baseline.yml
+    target_hosts: "{{ groups['all_network_devices'] }}"
+    platform_type: cisco_ios
+    enforce_mode: "{{ item }}"
+    require_plan: true
+  loop: ['dry_run', 'apply']
+
 - name: Validate policy only (no enforcement)
   policy_enforcer:
     policy_file: /etc/policies/compliance/nist_controls.yml
@@ -112,8 +161,10 @@ enforcement_results:
     firewall01:
       success: true
       changes_made: 5
+      unchanged_actions: 7
       backup_created: true
       backup_path: /backups/firewall01_20260126_123456.cfg
+      plan_file: /var/lib/policy_as_code/plans/firewall01_palo_alto_firewall-baseline-3f2a9c1e_plan.json
     firewall02:
       success: false
       error: "Connection timeout"
@@ -134,6 +185,7 @@ changes_summary:
     total_hosts: 2
     successful: 1
     failed: 1
+    compliant_hosts: 0
     total_changes: 5
     policies_applied: ['TLS 1.2+ Enforcement', 'Strong Cipher Suites']
 rollback_performed:
@@ -143,12 +195,28 @@ rollback_performed:
   sample: true
 '''
 
+import hashlib
 import json
 import os
 import yaml
 import time
 from ansible.module_utils.basic import AnsibleModule
-from datetime import datetime
+from ansible.module_utils.compliance_records import EnforcementChange
+from ansible.module_utils.validation_cache import ValidationCache
+from datetime import datetime, timedelta
+
+# Bump whenever the pre-enforcement validation rules change so stored results are not reused
+VALIDATOR_VERSION = 1
+
+# Bump whenever the plan file layout changes so older plans are rejected
+PLAN_VERSION = 1
+
+class StalePlanError(Exception):
+    """Plan no longer matches the policy, or is too old to apply"""
+
+def _differs(current, expected):
+    """Whether a current value needs changing; tolerates YAML/facts type differences ('900' == 900)"""
+    return not (current == expected or (current is not None and str(current) == str(expected)))
 
 class PolicyEnforcer:
     """Policy enforcement engine for multi-platform infrastructure"""
@@ -163,9 +231,20 @@ class PolicyEnforcer:
         self.rollback_on_failure = module.params['rollback_on_failure']
         self.validation_required = module.params['validation_required']
         self.approval_required = module.params['approval_required']
+        self.validation_cache = None
+        if module.params['validation_cache_dir']:
+            self.validation_cache = ValidationCache(
+                module.params['validation_cache_dir'], 'policy_enforcer', VALIDATOR_VERSION
+            )
+        self.plan_dir = module.params['plan_dir']
+        self.plan_max_age = module.params['plan_max_age']
+        self.require_plan = module.params['require_plan']
+        self.policy_content = None
+        self.policy_hash = None
 
         self.enforcement_results = {}
         self.rollback_performed = False
+        self.run_timestamp = datetime.now().isoformat()
 
     def enforce(self):
         """Main enforcement workflow"""
@@ -201,11 +280,11 @@ class PolicyEnforcer:
 
             return {
                 'enforced': all(r.get('success', False) for r in self.enforcement_results.values()),
-                'enforcement_results': self.enforcement_results,
+                'enforcement_results': self._serialize_results(),
                 'validation_results': validation_results,
                 'changes_summary': changes_summary,
                 'rollback_performed': self.rollback_performed,
-                'changed': self.enforce_mode == 'apply' and changes_summary['successful'] > 0
+                'changed': self.enforce_mode == 'apply' and changes_summary['total_changes'] > 0
             }
 
         except Exception as e:
@@ -217,13 +296,22 @@ class PolicyEnforcer:
             self.module.fail_json(msg=f"Policy file not found: {self.policy_file}")
 
         try:
-            with open(self.policy_file, 'r') as f:
-                return yaml.safe_load(f)
+            with open(self.policy_file, 'rb') as f:
+                self.policy_content = f.read()
+            self.policy_hash = hashlib.sha256(self.policy_content).hexdigest()
+            return yaml.safe_load(self.policy_content)
         except Exception as e:
             self.module.fail_json(msg=f"Failed to parse policy file: {str(e)}")
 
     def _validate_policy(self, policy):
-        """Validate policy before enforcement"""
+        """Validate policy before enforcement, reusing the stored result for unchanged policies"""
+        cache_key = None
+        if self.validation_cache is not None:
+            cache_key = self.validation_cache.key(self.policy_content)
+            cached = self.validation_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         errors = []
         warnings = []
 
@@ -245,11 +333,14 @@ class PolicyEnforcer:
                 if field not in metadata:
                     errors.append(f"Policy metadata missing required field: {field}")
 
-        return {
+        result = {
             'valid': len(errors) == 0,
             'errors': errors,
             'warnings': warnings
         }
+        if cache_key is not None:
+            self.validation_cache.put(cache_key, result)
+        return result
 
     def _check_approval(self, policy):
         """Check if policy has required approvals"""
@@ -285,28 +376,45 @@ class PolicyEnforcer:
         }
 
         try:
-            # Create backup if required
-            if self.backup and self.enforce_mode == 'apply':
-                backup_path = self._create_backup(host)
-                result['backup_created'] = True
-                result['backup_path'] = backup_path
-
             # Apply policy based on platform type
             if self.enforce_mode == 'validate_only':
                 result['success'] = True
                 result['message'] = 'Validation only - no changes made'
             elif self.enforce_mode == 'dry_run':
-                changes = self._simulate_enforcement(host, policy)
+                changes, unchanged = self._simulate_enforcement(host, policy)
                 result['success'] = True
                 result['changes_made'] = len(changes)
+                result['unchanged_actions'] = unchanged
                 result['proposed_changes'] = changes
                 result['message'] = 'Dry run - no actual changes made'
+                plan_file = None
+                if self.plan_dir and not self.module.check_mode:
+                    plan_file = self._write_plan(host, changes, unchanged)
+                if plan_file:
+                    result['plan_file'] = plan_file
             elif self.enforce_mode == 'apply':
-                changes = self._apply_policy(host, policy)
-                result['success'] = True
-                result['changes_made'] = len(changes)
-                result['applied_changes'] = changes
-                result['message'] = f'Successfully applied {len(changes)} changes'
+                changes, unchanged, plan_file = self._planned_changes(host, policy)
+                result['unchanged_actions'] = unchanged
+                if plan_file:
+                    result['plan_file'] = plan_file
+                if not changes:
+                    result['success'] = True
+                    result['applied_changes'] = []
+                    result['message'] = 'Already compliant - no changes needed'
+                else:
+                    # Create backup if required
+                    if self.backup:
+                        backup_path = self._create_backup(host)
+                        result['backup_created'] = True
+                        result['backup_path'] = backup_path
+
+                    changes = self._apply_policy(host, changes)
+                    result['success'] = True
+                    result['changes_made'] = len(changes)
+                    result['applied_changes'] = changes
+                    result['message'] = f'Successfully applied {len(changes)} changes'
+                if plan_file:
+                    self._discard_plan(plan_file)
 
         except Exception as e:
             result['success'] = False
@@ -348,56 +456,131 @@ class PolicyEnforcer:
         return backup_path
 
     def _simulate_enforcement(self, host, policy):
-        """Simulate policy enforcement (dry run)"""
+        """Simulate policy enforcement (dry run), returning the differing changes and the unchanged count"""
         changes = []
+        unchanged = 0
 
         # Extract enforcement actions from policy
         enforcement = policy.get('enforcement', {})
         actions = enforcement.get('actions', [])
 
-        for action in actions:
-            change = {
-                'action': action.get('type', 'configure'),
-                'target': action.get('target', 'unknown'),
-                'description': action.get('description', 'No description'),
-                'expected_value': action.get('value'),
-                'current_value': self._get_current_value(host, action)
-            }
-            changes.append(change)
-
         # If no explicit actions, generate from policy requirements
-        if not changes:
+        if not actions:
             requirements = policy.get('policy', {}).get('requirements', [])
-            for req in requirements:
-                change = {
-                    'action': 'configure',
+            actions = [
+                {
+                    'type': 'configure',
                     'target': req.get('parameter', 'unknown'),
                     'description': req.get('description', 'No description'),
-                    'expected_value': req.get('expected_value'),
-                    'current_value': 'not_compliant'
+                    'value': req.get('expected_value')
                 }
-                changes.append(change)
+                for req in requirements
+            ]
 
-        return changes
+        for action in actions:
+            current_value = self._get_current_value(host, action)
+            if not _differs(current_value, action.get('value')):
+                unchanged += 1
+                continue
+            changes.append(EnforcementChange(
+                action=action.get('type', 'configure'),
+                target=action.get('target', 'unknown'),
+                description=action.get('description', 'No description'),
+                expected_value=action.get('value'),
+                current_value=current_value
+            ))
+
+        return changes, unchanged
+
+    def _plan_path(self, host):
+        # Keyed by the policy's path, not its content, so apply still finds and rejects stale plans
+        stem = os.path.splitext(os.path.basename(self.policy_file))[0]
+        path_hash = hashlib.sha256(os.path.abspath(self.policy_file).encode('utf-8')).hexdigest()[:8]
+        return os.path.join(self.plan_dir, f"{host}_{self.platform_type}_{stem}-{path_hash}_plan.json")
+
+    def _write_plan(self, host, changes, unchanged):
+        """Persist a host's plan for a later apply; returns its path, or None when it cannot be written"""
+        plan_path = self._plan_path(host)
+        plan = {
+            'version': PLAN_VERSION,
+            'host': host,
+            'platform_type': self.platform_type,
+            'policy_file': self.policy_file,
+            'policy_hash': self.policy_hash,
+            'created': self.run_timestamp,
+            'unchanged_actions': unchanged,
+            'changes': [change.to_dict() for change in changes]
+        }
+        try:
+            os.makedirs(self.plan_dir, exist_ok=True)
+            tmp_file = f"{plan_path}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(plan, f, default=str)
+            os.replace(tmp_file, plan_path)
+        except (OSError, TypeError, ValueError) as e:
+            self.module.warn(f"Failed to save plan for {host}: {str(e)}")
+            return None
+        return plan_path
+
+    def _planned_changes(self, host, policy):
+        """Changes to apply from the host's plan, planning the host now when it has none"""
+        plan_path = self._plan_path(host) if self.plan_dir else None
+        if plan_path is None or not os.path.exists(plan_path):
+            if self.require_plan:
+                raise StalePlanError(f"No plan for {host} - run enforce_mode=dry_run first")
+            changes, unchanged = self._simulate_enforcement(host, policy)
+            return changes, unchanged, None
+
+        try:
+            with open(plan_path, 'r') as f:
+                plan = json.load(f)
+        except (OSError, ValueError) as e:
+            raise StalePlanError(f"Failed to read plan {plan_path}: {str(e)}")
+
+        if plan.get('version') != PLAN_VERSION or plan.get('platform_type') != self.platform_type:
+            raise StalePlanError(f"Plan {plan_path} was not made for this enforcer - run dry_run again")
+        if plan.get('policy_hash') != self.policy_hash:
+            raise StalePlanError(f"Plan {plan_path} is stale - the policy changed since the dry run")
+        created = datetime.fromisoformat(plan['created'])
+        if datetime.now() - created > timedelta(hours=self.plan_max_age):
+            raise StalePlanError(
+                f"Plan {plan_path} is stale - created {plan['created']}, older than {self.plan_max_age} hours"
+            )
+
+        changes = [
+            EnforcementChange(
+                action=change['action'],
+                target=change['target'],
+                description=change['description'],
+                expected_value=change['expected_value'],
+                current_value=change['current_value']
+            )
+            for change in plan['changes']
+        ]
+        return changes, plan['unchanged_actions'], plan_path
+
+    def _discard_plan(self, plan_path):
+        """Remove an executed plan so it is never applied twice"""
+        try:
+            os.remove(plan_path)
+        except OSError as e:
+            self.module.warn(f"Failed to remove applied plan {plan_path}: {str(e)}")
 
-    def _apply_policy(self, host, policy):
-        """Apply policy to host"""
+    def _apply_policy(self, host, changes):
+        """Apply planned changes to host"""
         # In real implementation, this would:
         # 1. Connect to the host using appropriate method (SSH, API, etc.)
         # 2. Execute configuration commands
         # 3. Verify changes were applied
         # 4. Return list of changes made
 
-        # For this framework, we'll simulate the application
-        changes = self._simulate_enforcement(host, policy)
-
         # Simulate application delay
         time.sleep(0.1)
 
         # Mark as applied
         for change in changes:
-            change['applied'] = True
-            change['applied_at'] = datetime.now().isoformat()
+            change.applied = True
+            change.applied_at = self.run_timestamp
 
         return changes
 
@@ -420,11 +603,25 @@ class PolicyEnforcer:
         # For now, just log
         self.module.warn(f"Rolling back {host} to {backup_path}")
 
+    def _serialize_results(self):
+        """Convert change records in the per-host results to their JSON shape"""
+        serialized = {}
+        for host, result in self.enforcement_results.items():
+            serialized[host] = dict(result)
+            for key in ('proposed_changes', 'applied_changes'):
+                if key in result:
+                    serialized[host][key] = [change.to_dict() for change in result[key]]
+        return serialized
+
     def _generate_summary(self):
         """Generate enforcement summary"""
         total_hosts = len(self.enforcement_results)
         successful = sum(1 for r in self.enforcement_results.values() if r.get('success', False))
         failed = total_hosts - successful
+        compliant_hosts = sum(
+            1 for r in self.enforcement_results.values()
+            if r.get('success', False) and 'unchanged_actions' in r and r.get('changes_made', 0) == 0
+        )
         total_changes = sum(r.get('changes_made', 0) for r in self.enforcement_results.values())
 
         # Extract unique policies applied
@@ -432,12 +629,13 @@ class PolicyEnforcer:
         for result in self.enforcement_results.values():
             if 'applied_changes' in result:
                 for change in result['applied_changes']:
-                    policies_applied.add(change.get('description', 'Unknown'))
+                    policies_applied.add(change.description)
 
         return {
             'total_hosts': total_hosts,
             'successful': successful,
             'failed': failed,
+            'compliant_hosts': compliant_hosts,
             'total_changes': total_changes,
             'policies_applied': list(policies_applied)
         }
@@ -453,11 +651,18 @@ def main():
             backup=dict(type='bool', required=False, default=True),
             rollback_on_failure=dict(type='bool', required=False, default=True),
             validation_required=dict(type='bool', required=False, default=True),
-            approval_required=dict(type='bool', required=False, default=True)
+            approval_required=dict(type='bool', required=False, default=True),
+            validation_cache_dir=dict(type='path', required=False, default='/var/lib/policy_as_code/validation_cache'),
+            plan_dir=dict(type='path', required=False, default='/var/lib/policy_as_code/plans'),
+            plan_max_age=dict(type='int', required=False, default=24),
+            require_plan=dict(type='bool', required=False, default=False)
         ),
         supports_check_mode=True
     )
 
+    if module.params['plan_max_age'] < 1:
+        module.fail_json(msg="plan_max_age must be at least 1")
+
     # Override enforce_mode if in check_mode
     if module.check_mode:
         module.params['enforce_mode'] = 'dry_run'
@@ -16,25 +16,114 @@ description:
   - Checks policy compliance with NIST 800-53, DISA STIG, IEC 62443
   - Validates policy structure, required fields, and value ranges
   - Supports Fourth Estate specific policy requirements
+  - Validates a whole policy library in one invocation with I(policy_dir)
+    or I(policy_glob), spreading files over a process pool
+  - Detects policies of a library that pin the same parameter on the same
+    platform to different values, or redundantly to the same value
+  - Checks mapped NIST 800-53 control IDs against a local OSCAL catalog
+  - Checks mapped DISA STIG findings against a finding store built by
+    M(stig_ingest)
 version_added: "1.0.0"
 options:
   policy_file:
     description:
       - Path to the policy file to validate
-    required: true
+      - One of I(policy_file), I(policy_dir) or I(policy_glob) is required
+    required: false
     type: path
+  policy_dir:
+    description:
+      - Validate every C(.yml), C(.yaml) and C(.json) policy below this directory
+    required: false
+    type: path
+  policy_glob:
+    description:
+      - Validate every policy matching this glob pattern; C(**) matches
+        nested directories
+    required: false
+    type: str
+  detect_conflicts:
+    description:
+      - In batch mode, index every value pinned by the library's requirements
+        and enforcement actions by platform and parameter, and report
+        conflicting and redundant policies
+      - Conflicts make the batch invalid; redundancies only do in I(strict_mode)
+    required: false
+    type: bool
+    default: true
+  max_workers:
+    description:
+      - Number of worker processes used to validate policies in batch mode
+      - Defaults to the number of CPUs; C(1) validates in-process
+    required: false
+    type: int
   policy_type:
     description:
       - Type of policy being validated
-    required: true
+      - When omitted, taken from C(metadata.policy_type) or C(metadata.type),
+        or from the name of the directory holding the policy
+    required: false
     type: str
     choices: ['security', 'compliance', 'network', 'access', 'data', 'backup', 'monitoring', 'change']
   schema_dir:
     description:
       - Directory containing policy schemas
+      - A policy is validated against the JSON Schema C(<policy_type>.json)
+        in this directory when one exists; the schema then replaces the
+        built-in required field checks
     required: false
     type: path
     default: '/etc/policy_as_code/schemas'
+  schema_cache_dir:
+    description:
+      - Directory recording schemas that already passed the JSON Schema
+        metaschema check, keyed by schema hash, so later runs skip the check
+      - The cache is best effort; an unwritable directory only disables it
+    required: false
+    type: path
+    default: '/var/lib/policy_as_code/schema_cache'
+  validation_cache_dir:
+    description:
+      - Directory of stored validation results, keyed by a hash of the policy
+        file content, the validator version and every option that affects
+        the result
+      - An unchanged policy validated with the same options and schemas is
+        answered from the cache without being parsed
+      - Set to an empty string to disable the cache
+    required: false
+    type: path
+    default: '/var/lib/policy_as_code/validation_cache'
+  nist_catalog:
+    description:
+      - Local NIST SP 800-53 OSCAL catalog JSON
+      - When set, every control in C(compliance.nist_800_53.controls) must
+        be a control or enhancement of the catalog; withdrawn controls raise
+        a warning naming the controls they were incorporated into
+    required: false
+    type: path
+  nist_profiles:
+    description:
+      - OSCAL baseline profile JSON files (LOW, MODERATE, HIGH, PRIVACY)
+        reporting which baselines include each mapped control
+    required: false
+    type: list
+    elements: path
+  catalog_cache_dir:
+    description:
+      - Directory storing the compact control index built from
+        I(nist_catalog) and I(nist_profiles); the catalog is parsed again
+        only when one of them changes
+    required: false
+    type: path
+    default: '/var/lib/policy_as_code/catalog_cache'
+  stig_store:
+    description:
+      - STIG finding store built by M(stig_ingest)
+      - When set, every finding in C(compliance.disa_stig.findings) must be
+        a vulnerability ID (V-ID) of an ingested benchmark, and findings are
+        grouped by their severity category (CAT I, II or III)
+    required: false
+    type: path
   compliance_frameworks:
     description:
       - List of compliance frameworks to validate against
@@ -54,6 +143,15 @@ options:
     required: false
     type: bool
     default: true
+requirements:
+  - jsonschema (when I(schema_dir) contains schemas)
+notes:
+  - For conflict detection a policy pins C(expected_value) of each
+    requirement whose C(check.operator) is C(eq) or unset, unless the value
+    is a list or mapping, and the C(value) of each enforcement action on its
+    C(target). Values are compared as strings, as the compliance checker does.
+  - A setting applies to the platforms in its own C(platform), else those in
+    C(metadata.platforms); settings without a platform apply to all platforms.
 author:
   - Fourth Estate Policy Team
 '''
@@ -78,10 +176,34 @@ EXAMPLES = r'''
 
 - name: Validate all policies in directory
   policy_validator:
-    policy_file: "{{ item }}"
-    policy_type: "{{ item | dirname | basename }}"
+    policy_dir: /etc/policies
     compliance_frameworks: ['nist_800_53']
-  loop: "{{ lookup('fileglob', '/etc/policies/**/*.yml', wantlist=True) }}"
+
+- name: Validate NIST control mappings against the OSCAL catalog
+  policy_validator:
+    policy_dir: /etc/policies
+    nist_catalog: /usr/share/oscal/NIST_SP-800-53_rev5_catalog.json
+    nist_profiles:
+      - /usr/share/oscal/NIST_SP-800-53_rev5_LOW-baseline_profile.json
+      - /usr/share/oscal/NIST_SP-800-53_rev5_MODERATE-baseline_profile.json
+      - /usr/share/oscal/NIST_SP-800-53_rev5_HIGH-baseline_profile.json
+
+- name: Validate DISA STIG finding mappings against the ingested benchmarks
+  policy_validator:
+    policy_dir: /etc/policies
+    stig_store: /var/lib/policy_as_code/stig.db
+
+- name: Validate the policy library and report conflicting policies
+  policy_validator:
+    policy_dir: /etc/policies
+    detect_conflicts: true
+  register: library
+
+- name: Validate security policies with four worker processes
+  policy_validator:
+    policy_glob: '/etc/policies/security/**/*.yml'
+    policy_type: security
+    max_workers: 4
 '''
 
 RETURN = r'''
@@ -105,23 +227,108 @@ validation_warnings:
   type: list
   elements: dict
   sample:
+    - field: 'metadata.owner'
+      error: "'owner' is a required property"
+      severity: 'high'
     - field: 'description'
       warning: 'Description should be more detailed (>100 chars recommended)'
       location: 'line 5'
 compliance_status:
-  description: Compliance framework validation results
+  description:
+    - Compliance framework validation results
+    - With I(nist_catalog), C(nist_800_53) also lists unknown and withdrawn
+      controls and the mapped controls of each I(nist_profiles) baseline
+    - With I(stig_store), C(disa_stig) also lists unknown findings and the
+      mapped findings of each severity category
   returned: always
   type: dict
   sample:
     nist_800_53:
       compliant: true
       controls_mapped: ['AC-2', 'AC-3', 'IA-5']
+      unknown_controls: []
+      withdrawn_controls: []
+      baselines:
+        LOW: ['AC-2', 'AC-3', 'IA-5']
     disa_stig:
       compliant: true
       findings_addressed: ['V-230221', 'V-230222']
+      unknown_findings: []
+      categories:
+        CAT II: ['V-230221', 'V-230222']
+cached:
+  description: Whether the result was answered from I(validation_cache_dir)
+  returned: always
+  type: bool
+  sample: false
+policies:
+  description:
+    - Per-file validation results in batch mode, with the C(policy_file) and
+      the C(policy_type) it was validated as
+    - Files that could not be loaded carry an C(error) instead of findings
+  returned: when policy_dir or policy_glob is set
+  type: list
+  elements: dict
+  sample:
+    - policy_file: /etc/policies/security/tls_enforcement.yml
+      policy_type: security
+      valid: true
+      validation_errors: []
+      validation_warnings: []
+conflicts:
+  description:
+    - Parameters pinned to different values on the same platform, with the
+      policies and requirement or action setting each value
+    - Platform C(*) covers settings that apply to all platforms
+  returned: when policy_dir or policy_glob is set and detect_conflicts is true
+  type: list
+  elements: dict
+  sample:
+    - platform: cisco_ios
+      parameter: line vty 0 4 > exec-timeout
+      values:
+        - value: '15 0'
+          policies:
+            - policy_file: /etc/policies/access/session_timeout.yml
+              source: policy.requirements[1]
+        - value: '10 0'
+          policies:
+            - policy_file: /etc/policies/security/hardening.yml
+              source: enforcement.actions[3]
+redundancies:
+  description: Parameters pinned to the same value by more than one policy
+  returned: when policy_dir or policy_glob is set and detect_conflicts is true
+  type: list
+  elements: dict
+  sample:
+    - platform: '*'
+      parameter: ssl.minimum_version
+      value: TLSv1.2
+      policy_files:
+        - /etc/policies/security/tls_enforcement.yml
+        - /etc/policies/network/mgmt_plane.yml
+summary:
+  description: Aggregate of a batch validation
+  returned: when policy_dir or policy_glob is set
+  type: dict
+  sample:
+    total: 120
+    valid: 117
+    invalid: 3
+    load_errors: 1
+    cached: 112
+    errors: 4
+    warnings: 38
+    by_type:
+      security: 41
+      access: 19
+    invalid_files:
+      - /etc/policies/data/retention.yml
+    conflicts: 1
+    redundancies: 1
 policy_metadata:
   description: Extracted policy metadata
-  returned: always
+  returned: when policy_file is set
   type: dict
   sample:
     name: 'TLS 1.2+ Enforcement'
@@ -130,382 +337,748 @@ policy_metadata:
     owner: 'security-team@example.com'
 '''
 
+import glob
 import json
 import os
 import yaml
-from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible.module_utils.compliance_records import ValidationIssue
+from ansible.module_utils.control_catalog import WITHDRAWN, CatalogError, ControlCatalog
+from ansible.module_utils.policy_schema import (
+    HAS_JSONSCHEMA, JSONSCHEMA_IMPORT_ERROR, PolicySchemaError, SchemaCache, has_schemas
+)
+from ansible.module_utils.stig_store import VULN_ID, StigStore
+from ansible.module_utils.validation_cache import ValidationCache
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
+
+POLICY_TYPES = ['security', 'compliance', 'network', 'access', 'data', 'backup', 'monitoring', 'change']
+
+POLICY_EXTENSIONS = ('.yml', '.yaml', '.json')
+
+# Platform of settings that apply to every platform
+ALL_PLATFORMS = '*'
+
+# Options passed to each validation in batch mode
+VALIDATION_OPTIONS = ('policy_type', 'schema_dir', 'schema_cache_dir', 'validation_cache_dir', 'nist_catalog',
+                      'nist_profiles', 'catalog_cache_dir', 'stig_store', 'compliance_frameworks',
+                      'strict_mode', 'fourth_estate_mode')
+
+# Bump whenever validation rules change so stored results are not reused
+VALIDATOR_VERSION = 3
+
+SEVERITIES = ['critical', 'high', 'medium', 'low']
+
+# Declarative validation rules, listed in the order their findings are reported.
+# Each rule checks the value at a dotted path with one of RULE_CHECKS:
+#   required      the path is missing while its parent section is present
+#   absent        the path is missing, whether or not its parent is present
+#   required_all  the section is present but lacks one of the argument keys
+#   choices       the value is present and not one of the argument values
+#   semver        the value is present and not X.Y.Z
+#   min_length    the value is present and shorter than argument
+#   min_value     the value, 0 when missing, is lower than argument
+#   non_empty     the value, [] when missing, is empty
+# A violated rule raises an issue under its field (the path by default) unless
+# it has no message. 'if' restricts a rule to policies whose value at a path
+# equals the given one; 'framework' rules also record compliance_status.
+STRUCTURE_RULES = [
+    {'path': field, 'check': 'required', 'kind': 'error', 'severity': 'critical',
+     'message': f"Required field '{field}' is missing"}
+    for field in ('metadata', 'policy', 'enforcement')
+] + [
+    {'path': f"metadata.{field}", 'check': 'required', 'kind': 'error', 'severity': 'high',
+     'message': f"Required metadata field '{field}' is missing"}
+    for field in ('name', 'version', 'description', 'owner', 'severity')
+]
+
+METADATA_RULES = [
+    {'path': 'metadata.severity', 'check': 'choices', 'argument': SEVERITIES, 'kind': 'error', 'severity': 'high',
+     'message': f"Invalid severity: must be one of {SEVERITIES}"},
+    {'path': 'metadata.version', 'check': 'semver', 'kind': 'warning', 'severity': 'low',
+     'message': 'Version should follow semantic versioning (X.Y.Z)'},
+    {'path': 'metadata.description', 'check': 'min_length', 'argument': 50, 'kind': 'warning', 'severity': 'low',
+     'message': 'Description is short ({length} chars). Recommend >50 chars for clarity'}
+]
+
+POLICY_TYPE_RULES = {
+    'security': [{'path': 'policy.encryption', 'check': 'required', 'kind': 'warning', 'severity': 'medium',
+                  'message': 'Security policy should define encryption requirements'}],
+    'compliance': [{'path': 'policy.controls', 'check': 'required', 'kind': 'error', 'severity': 'high',
+                    'message': 'Compliance policy must map to control frameworks'}],
+    'network': [{'path': 'policy.rules', 'check': 'required', 'kind': 'warning', 'severity': 'medium',
+                 'message': 'Network policy should define firewall/routing rules'}],
+    'access': [{'path': 'policy.roles', 'check': 'required', 'kind': 'warning', 'severity': 'medium',
+                'message': 'Access policy should define roles and permissions'}],
+    'data': [{'path': 'policy.classification', 'check': 'required', 'kind': 'error', 'severity': 'high',
+              'message': 'Data policy must define data classification levels'}],
+    'backup': [{'path': 'policy', 'check': 'required_all', 'argument': ('rpo', 'rto'), 'field': 'policy.rpo/rto',
+                'kind': 'error', 'severity': 'high', 'message': 'Backup policy must define RPO and RTO'}],
+    'monitoring': [{'path': 'policy.metrics', 'check': 'required', 'kind': 'warning', 'severity': 'medium',
+                    'message': 'Monitoring policy should define metrics and thresholds'}],
+    'change': [{'path': 'policy.approval_workflow', 'check': 'required', 'kind': 'error', 'severity': 'high',
+                'message': 'Change policy must define approval workflow'}]
+}
+
+FRAMEWORK_RULES = {
+    'nist_800_53': {'path': 'compliance.nist_800_53.controls', 'check': 'non_empty', 'framework': 'nist_800_53',
+                    'status': 'controls_mapped', 'kind': 'warning', 'severity': 'medium',
+                    'message': 'No NIST 800-53 controls mapped'},
+    'disa_stig': {'path': 'compliance.disa_stig.findings', 'check': 'non_empty', 'framework': 'disa_stig',
+                  'status': 'findings_addressed', 'kind': 'warning', 'severity': 'medium',
+                  'message': 'No DISA STIG findings mapped'},
+    'iec_62443': {'path': 'compliance.iec_62443.requirements', 'check': 'non_empty', 'framework': 'iec_62443',
+                  'status': 'requirements_met', 'kind': 'warning', 'severity': 'medium', 'message': None},
+    'nerc_cip': {'path': 'compliance.nerc_cip.standards', 'check': 'non_empty', 'framework': 'nerc_cip',
+                 'status': 'standards_met', 'kind': 'warning', 'severity': 'medium', 'message': None}
+}
+
+FOURTH_ESTATE_RULES = [
+    {'path': 'policy.source_protection', 'check': 'absent', 'kind': 'warning', 'severity': 'high',
+     'message': 'Fourth Estate policy should address source protection requirements'},
+    {'path': 'approval.required_approvers', 'check': 'min_value', 'argument': 2,
+     'if': ('metadata.severity', 'critical'), 'kind': 'error', 'severity': 'high',
+     'message': 'Critical severity policies require at least 2 approvers'}
+]
+
+# Each check returns None when the rule holds, or the message format arguments of its issue
+def _check_required(value, present, parent_present, argument):
+    return {} if parent_present and not present else None
+
+def _check_absent(value, present, parent_present, argument):
+    return None if present else {}
+
+def _check_required_all(value, present, parent_present, argument):
+    return {} if present and not all(key in value for key in argument) else None
+
+def _check_choices(value, present, parent_present, argument):
+    return {} if present and value not in argument else None
+
+def _check_semver(value, present, parent_present, argument):
+    if not present:
+        return None
+    parts = str(value).split('.')
+    return None if len(parts) == 3 and all(part.isdigit() for part in parts) else {}
+
+def _check_min_length(value, present, parent_present, argument):
+    return {'length': len(value)} if present and len(value) < argument else None
+
+def _check_min_value(value, present, parent_present, argument):
+    return {} if (value if present else 0) < argument else None
+
+def _check_non_empty(value, present, parent_present, argument):
+    return {} if len(value if present else []) == 0 else None
+
+RULE_CHECKS = {
+    'required': _check_required,
+    'absent': _check_absent,
+    'required_all': _check_required_all,
+    'choices': _check_choices,
+    'semver': _check_semver,
+    'min_length': _check_min_length,
+    'min_value': _check_min_value,
+    'non_empty': _check_non_empty
+}
+
+# Value of a path that is absent from the policy
+_MISSING = object()
+
+def _lookup(data, path):
+    """Value at a dotted path, or None when any part of it is missing"""
+    for key in path.split('.'):
+        if not isinstance(data, dict) or key not in data:
+            return None
+        data = data[key]
+    return data
+
+class RulePlan:
+    """Validation rules compiled into one walk over the paths they check
+
+    Rule paths are merged into a tree and flattened in depth-first order, so
+    each policy value is fetched once however many rules check it.
+    """
+
+    def __init__(self, rules):
+        tree = {}
+        for ordinal, rule in enumerate(rules):
+            node = ({}, [])
+            children = tree
+            for key in rule['path'].split('.'):
+                node = children.setdefault(key, ({}, []))
+                children = node[0]
+            condition = rule.get('if')
+            node[1].append((
+                ordinal,
+                RULE_CHECKS[rule['check']],
+                rule.get('argument'),
+                (condition[0], condition[1]) if condition else None,
+                (rule['framework'], rule['status']) if 'framework' in rule else None,
+                (rule.get('field', rule['path']), rule['kind'], rule['message'], rule['severity'])
+                if rule['message'] is not None else None
+            ))
+
+        # (key, parent node index, checks) in depth-first order; index 0 is the policy root
+        self.nodes = []
+        self._flatten(tree, 0)
+
+    def _flatten(self, children, parent):
+        for key, (grandchildren, checks) in children.items():
+            self.nodes.append((key, parent, checks))
+            self._flatten(grandchildren, len(self.nodes))
+
+    def apply(self, policy_data):
+        """Issues and framework compliance status of a policy, in rule table order"""
+        issues = []
+        statuses = []
+        values = [policy_data]
+        for key, parent, checks in self.nodes:
+            parent_value = values[parent]
+            value = parent_value.get(key, _MISSING) if isinstance(parent_value, dict) else _MISSING
+            values.append(value)
+            if not checks:
+                continue
+
+            parent_present = parent_value is not _MISSING
+            present = value is not _MISSING
+            if not present:
+                value = None
+            for ordinal, check, argument, condition, status, issue in checks:
+                if condition is not None and _lookup(policy_data, condition[0]) != condition[1]:
+                    continue
+                if status is not None:
+                    mapped = value if present else []
+                    statuses.append((ordinal, status[0], {'compliant': len(mapped) > 0, status[1]: mapped}))
+
+                arguments = check(value, present, parent_present, argument)
+                if arguments is not None and issue is not None:
+                    field, kind, message, severity = issue
+                    issues.append((ordinal, ValidationIssue(
+                        field=field,
+                        kind=kind,
+                        message=message.format(**arguments) if arguments else message,
+                        severity=severity
+                    )))
+
+        issues.sort(key=lambda item: item[0])
+        statuses.sort(key=lambda item: item[0])
+        return [issue for _, issue in issues], {framework: status for _, framework, status in statuses}
+
+@lru_cache(maxsize=64)
+def compile_rules(policy_type, compliance_frameworks, fourth_estate_mode, structure=True):
+    """RulePlan for one combination of validation options"""
+    rules = list(STRUCTURE_RULES) if structure else []
+    rules.extend(METADATA_RULES)
+    rules.extend(POLICY_TYPE_RULES.get(policy_type, []))
+    rules.extend(FRAMEWORK_RULES[framework] for framework in compliance_frameworks if framework in FRAMEWORK_RULES)
+    if fourth_estate_mode:
+        rules.extend(FOURTH_ESTATE_RULES)
+    return RulePlan(rules)
+
+@lru_cache(maxsize=4)
+def open_stig_store(path):
+    """STIG finding store kept open read-only for every policy validated by this process"""
+    return StigStore(path, read_only=True)
+
+class PolicyLoadError(Exception):
+    """Policy file is missing or cannot be parsed"""
 
 class PolicyValidator:
     """Policy validation engine for Fourth Estate compliance"""
 
-    def __init__(self, module):
+    def __init__(self, module, params=None):
         self.module = module
-        self.policy_file = module.params['policy_file']
-        self.policy_type = module.params['policy_type']
-        self.schema_dir = module.params['schema_dir']
-        self.compliance_frameworks = module.params['compliance_frameworks']
-        self.strict_mode = module.params['strict_mode']
-        self.fourth_estate_mode = module.params['fourth_estate_mode']
+        params = params if params is not None else module.params
+        self.policy_file = params['policy_file']
+        self.policy_type = params['policy_type']
+        self.schema_dir = params['schema_dir']
+        self.compliance_frameworks = params['compliance_frameworks']
+        self.strict_mode = params['strict_mode']
+        self.fourth_estate_mode = params['fourth_estate_mode']
+        self.nist_catalog = params['nist_catalog']
+        self.nist_profiles = params['nist_profiles']
+        self.catalog_cache_dir = params['catalog_cache_dir']
+        self.catalog = None
+        self.stig_store_path = params['stig_store']
+        self.stig_store = None
+        self.schema_cache = SchemaCache(self.schema_dir, params['schema_cache_dir'])
+        self.validation_cache = None
+        if params['validation_cache_dir']:
+            self.validation_cache = ValidationCache(
+                params['validation_cache_dir'], 'policy_validator', VALIDATOR_VERSION
+            )
 
         self.errors = []
         self.warnings = []
         self.compliance_status = {}
+        self.settings = []
 
     def validate(self):
         """Main validation workflow"""
         try:
-            # Load policy file
-            policy_data = self._load_policy()
-
-            # Validate structure
-            self._validate_structure(policy_data)
-
-            # Validate metadata
-            self._validate_metadata(policy_data)
-
-            # Validate policy type specific rules
-            self._validate_policy_type(policy_data)
-
-            # Validate compliance frameworks
-            self._validate_compliance(policy_data)
-
-            # Fourth Estate specific validation
-            if self.fourth_estate_mode:
-                self._validate_fourth_estate(policy_data)
-
-            # Determine overall validation result
-            valid = len(self.errors) == 0
-            if self.strict_mode and len(self.warnings) > 0:
-                valid = False
-
-            return {
-                'valid': valid,
-                'validation_errors': self.errors,
-                'validation_warnings': self.warnings,
-                'compliance_status': self.compliance_status,
-                'policy_metadata': policy_data.get('metadata', {}),
-                'changed': False
-            }
-
+            return self.validate_policy()
+        except (PolicyLoadError, PolicySchemaError, CatalogError) as e:
+            self.module.fail_json(msg=str(e))
         except Exception as e:
             self.module.fail_json(msg=f"Validation failed: {str(e)}")
 
-    def _load_policy(self):
-        """Load and parse policy file"""
-        if not os.path.exists(self.policy_file):
-            self.module.fail_json(msg=f"Policy file not found: {self.policy_file}")
-
-        try:
-            with open(self.policy_file, 'r') as f:
-                if self.policy_file.endswith('.json'):
-                    return json.load(f)
-                else:
-                    return yaml.safe_load(f)
-        except Exception as e:
-            self.module.fail_json(msg=f"Failed to parse policy file: {str(e)}")
-
-    def _validate_structure(self, policy_data):
-        """Validate basic policy structure"""
-        required_fields = ['metadata', 'policy', 'enforcement']
-
-        for field in required_fields:
-            if field not in policy_data:
-                self.errors.append({
-                    'field': field,
-                    'error': f"Required field '{field}' is missing",
-                    'severity': 'critical'
-                })
-
-        # Validate metadata structure
-        if 'metadata' in policy_data:
-            metadata = policy_data['metadata']
-            required_meta = ['name', 'version', 'description', 'owner', 'severity']
-
-            for field in required_meta:
-                if field not in metadata:
-                    self.errors.append({
-                        'field': f"metadata.{field}",
-                        'error': f"Required metadata field '{field}' is missing",
-                        'severity': 'high'
-                    })
-
-    def _validate_metadata(self, policy_data):
-        """Validate policy metadata"""
-        if 'metadata' not in policy_data:
-            return
-
-        metadata = policy_data['metadata']
-
-        # Validate severity
-        valid_severities = ['critical', 'high', 'medium', 'low']
-        if 'severity' in metadata and metadata['severity'] not in valid_severities:
-            self.errors.append({
-                'field': 'metadata.severity',
-                'error': f"Invalid severity: must be one of {valid_severities}",
-                'severity': 'high'
-            })
-
-        # Validate version format (semver)
-        if 'version' in metadata:
-            version = metadata['version']
-            parts = version.split('.')
-            if len(parts) != 3 or not all(p.isdigit() for p in parts):
-                self.warnings.append({
-                    'field': 'metadata.version',
-                    'warning': 'Version should follow semantic versioning (X.Y.Z)',
-                    'severity': 'low'
-                })
-
-        # Validate description length
-        if 'description' in metadata:
-            desc_len = len(metadata['description'])
-            if desc_len < 50:
-                self.warnings.append({
-                    'field': 'metadata.description',
-                    'warning': f"Description is short ({desc_len} chars). Recommend >50 chars for clarity",
-                    'severity': 'low'
-                })
-
-    def _validate_policy_type(self, policy_data):
-        """Validate policy type specific requirements"""
-        validators = {
-            'security': self._validate_security_policy,
-            'compliance': self._validate_compliance_policy,
-            'network': self._validate_network_policy,
-            'access': self._validate_access_policy,
-            'data': self._validate_data_policy,
-            'backup': self._validate_backup_policy,
-            'monitoring': self._validate_monitoring_policy,
-            'change': self._validate_change_policy
+    def validate_policy(self):
+        """Validate the policy file, raising PolicyLoadError when it cannot be read"""
+        if self.nist_catalog and 'nist_800_53' in self.compliance_frameworks:
+            self.catalog = ControlCatalog.load(self.nist_catalog, self.nist_profiles, self.catalog_cache_dir)
+        if self.stig_store_path and 'disa_stig' in self.compliance_frameworks:
+            self.stig_store = open_stig_store(self.stig_store_path)
+
+        # Load policy file, answering unchanged policies from the validation cache
+        content = self._read_policy()
+        cache_key = None
+        if self.validation_cache is not None:
+            cache_key = self._cache_key(content)
+            cached = self.validation_cache.get(cache_key)
+            if cached is not None:
+                self.policy_type = cached['policy_type']
+                self.settings = cached['settings']
+                return dict(cached['result'], cached=True)
+
+        policy_data = self._parse_policy(content)
+        if self.policy_type is None:
+            self.policy_type = self._infer_policy_type(policy_data)
+
+        # Validate against the policy type's schema, which replaces the built-in structure rules
+        has_schema = self._validate_schema(policy_data)
+
+        # Structure, metadata, policy type, framework and Fourth Estate rules in one pass
+        plan = compile_rules(self.policy_type, tuple(self.compliance_frameworks), self.fourth_estate_mode,
+                             not has_schema)
+        issues, self.compliance_status = plan.apply(policy_data)
+        for issue in issues:
+            (self.errors if issue.kind == 'error' else self.warnings).append(issue)
+        if self.catalog is not None and 'nist_800_53' in self.compliance_status:
+            self._validate_nist_controls(self.compliance_status['nist_800_53'])
+        if self.stig_store is not None and 'disa_stig' in self.compliance_status:
+            self._validate_stig_findings(self.compliance_status['disa_stig'])
+
+        # Values the policy pins, for conflict detection across a library
+        self.settings = self._policy_settings(policy_data)
+
+        # Determine overall validation result
+        valid = len(self.errors) == 0
+        if self.strict_mode and len(self.warnings) > 0:
+            valid = False
+
+        result = {
+            'valid': valid,
+            'validation_errors': [issue.to_dict() for issue in self.errors],
+            'validation_warnings': [issue.to_dict() for issue in self.warnings],
+            'compliance_status': self.compliance_status,
+            'policy_metadata': policy_data.get('metadata', {}),
+            'cached': False,
+            'changed': False
         }
-
-        validator = validators.get(self.policy_type)
-        if validator:
-            validator(policy_data)
-
-    def _validate_security_policy(self, policy_data):
-        """Validate security-specific policy requirements"""
-        if 'policy' not in policy_data:
-            return
-
-        policy = policy_data['policy']
-
-        # Security policies should define encryption requirements
-        if 'encryption' not in policy:
-            self.warnings.append({
-                'field': 'policy.encryption',
-                'warning': 'Security policy should define encryption requirements',
-                'severity': 'medium'
-            })
-
-    def _validate_compliance_policy(self, policy_data):
-        """Validate compliance-specific policy requirements"""
-        if 'policy' not in policy_data:
-            return
-
-        policy = policy_data['policy']
-
-        # Compliance policies must map to controls
-        if 'controls' not in policy:
-            self.errors.append({
-                'field': 'policy.controls',
-                'error': 'Compliance policy must map to control frameworks',
-                'severity': 'high'
-            })
-
-    def _validate_network_policy(self, policy_data):
-        """Validate network-specific policy requirements"""
-        if 'policy' not in policy_data:
-            return
-
-        policy = policy_data['policy']
-
-        # Network policies should define rules
-        if 'rules' not in policy:
-            self.warnings.append({
-                'field': 'policy.rules',
-                'warning': 'Network policy should define firewall/routing rules',
-                'severity': 'medium'
-            })
-
-    def _validate_access_policy(self, policy_data):
-        """Validate access control policy requirements"""
-        if 'policy' not in policy_data:
-            return
-
-        policy = policy_data['policy']
-
-        # Access policies should define roles and permissions
-        if 'roles' not in policy:
-            self.warnings.append({
-                'field': 'policy.roles',
-                'warning': 'Access policy should define roles and permissions',
-                'severity': 'medium'
-            })
-
-    def _validate_data_policy(self, policy_data):
-        """Validate data protection policy requirements"""
-        if 'policy' not in policy_data:
-            return
-
-        policy = policy_data['policy']
-
-        # Data policies should define classification
-        if 'classification' not in policy:
-            self.errors.append({
-                'field': 'policy.classification',
-                'error': 'Data policy must define data classification levels',
-                'severity': 'high'
-            })
-
-    def _validate_backup_policy(self, policy_data):
-        """Validate backup policy requirements"""
-        if 'policy' not in policy_data:
-            return
-
-        policy = policy_data['policy']
-
-        # Backup policies must define RPO/RTO
-        if 'rpo' not in policy or 'rto' not in policy:
-            self.errors.append({
-                'field': 'policy.rpo/rto',
-                'error': 'Backup policy must define RPO and RTO',
-                'severity': 'high'
+        if cache_key is not None:
+            self.validation_cache.put(cache_key, {
+                'policy_type': self.policy_type, 'result': result, 'settings': self.settings
             })
+        return result
 
-    def _validate_monitoring_policy(self, policy_data):
-        """Validate monitoring policy requirements"""
-        if 'policy' not in policy_data:
+    def _validate_nist_controls(self, status):
+        """Look up every mapped NIST 800-53 control in the indexed OSCAL catalog"""
+        controls = status['controls_mapped']
+        if not isinstance(controls, list):
             return
 
-        policy = policy_data['policy']
-
-        # Monitoring policies should define metrics and thresholds
-        if 'metrics' not in policy:
-            self.warnings.append({
-                'field': 'policy.metrics',
-                'warning': 'Monitoring policy should define metrics and thresholds',
-                'severity': 'medium'
-            })
-
-    def _validate_change_policy(self, policy_data):
-        """Validate change management policy requirements"""
-        if 'policy' not in policy_data:
+        unknown = []
+        withdrawn = []
+        baselines = {name: [] for name in self.catalog.baselines}
+        for index, control in enumerate(controls):
+            field = f"compliance.nist_800_53.controls[{index}]"
+            control_id, flags = self.catalog.lookup(control)
+            if flags is None:
+                unknown.append(control)
+                self.errors.append(ValidationIssue(
+                    field=field,
+                    kind='error',
+                    message=f"Unknown NIST 800-53 control {control}" if control_id
+                    else f"{control!r} is not a NIST 800-53 control identifier",
+                    severity='high'
+                ))
+            elif flags & WITHDRAWN:
+                withdrawn.append(control_id)
+                replacements = self.catalog.withdrawn.get(control_id)
+                message = f"NIST 800-53 control {control_id} is withdrawn"
+                if replacements:
+                    message += f" - incorporated into {', '.join(replacements)}"
+                self.warnings.append(ValidationIssue(
+                    field=field,
+                    kind='warning',
+                    message=message,
+                    severity='medium'
+                ))
+            else:
+                for name in self.catalog.control_baselines(flags):
+                    baselines[name].append(control_id)
+
+        status['compliant'] = status['compliant'] and not unknown
+        status['unknown_controls'] = unknown
+        status['withdrawn_controls'] = withdrawn
+        if baselines:
+            status['baselines'] = baselines
+
+    def _validate_stig_findings(self, status):
+        """Look up every mapped DISA STIG finding in the STIG store with one query"""
+        findings = status['findings_addressed']
+        if not isinstance(findings, list):
             return
 
-        policy = policy_data['policy']
-
-        # Change policies should define approval workflow
-        if 'approval_workflow' not in policy:
-            self.errors.append({
-                'field': 'policy.approval_workflow',
-                'error': 'Change policy must define approval workflow',
-                'severity': 'high'
-            })
-
-    def _validate_compliance(self, policy_data):
-        """Validate against compliance frameworks"""
-        for framework in self.compliance_frameworks:
-            if framework == 'nist_800_53':
-                self._validate_nist_80053(policy_data)
-            elif framework == 'disa_stig':
-                self._validate_disa_stig(policy_data)
-            elif framework == 'iec_62443':
-                self._validate_iec_62443(policy_data)
-            elif framework == 'nerc_cip':
-                self._validate_nerc_cip(policy_data)
-
-    def _validate_nist_80053(self, policy_data):
-        """Validate NIST 800-53 compliance"""
-        controls = policy_data.get('compliance', {}).get('nist_800_53', {}).get('controls', [])
-
-        self.compliance_status['nist_800_53'] = {
-            'compliant': len(controls) > 0,
-            'controls_mapped': controls
-        }
-
-        if len(controls) == 0:
-            self.warnings.append({
-                'field': 'compliance.nist_800_53.controls',
-                'warning': 'No NIST 800-53 controls mapped',
-                'severity': 'medium'
-            })
+        known = self.stig_store.lookup(findings)
+        unknown = []
+        categories = {}
+        for index, finding in enumerate(findings):
+            vuln_id = str(finding).strip().upper()
+            stig = known.get(vuln_id)
+            if stig is None:
+                unknown.append(finding)
+                self.errors.append(ValidationIssue(
+                    field=f"compliance.disa_stig.findings[{index}]",
+                    kind='error',
+                    message=f"Unknown DISA STIG finding {finding}" if VULN_ID.fullmatch(vuln_id)
+                    else f"{finding!r} is not a DISA STIG vulnerability ID",
+                    severity='high'
+                ))
+            else:
+                categories.setdefault(stig['category'] or 'uncategorized', []).append(vuln_id)
+
+        status['compliant'] = status['compliant'] and not unknown
+        status['unknown_findings'] = unknown
+        status['categories'] = categories
+
+    def _policy_settings(self, policy_data):
+        """[platform, parameter, value, source] for each value pinned by a requirement or action"""
+        metadata = policy_data.get('metadata') or {}
+        policy_platforms = _as_platforms(metadata.get('platforms'))
+        pinned = []
+
+        requirements = (policy_data.get('policy') or {}).get('requirements') or []
+        for index, req in enumerate(requirements):
+            if not isinstance(req, dict) or 'parameter' not in req or 'expected_value' not in req:
+                continue
+            operator = (req.get('check') or {}).get('operator', 'eq')
+            if operator != 'eq' or isinstance(req['expected_value'], (dict, list)):
+                continue
+            pinned.append((req, req['parameter'], req['expected_value'], f"policy.requirements[{index}]"))
+
+        actions = (policy_data.get('enforcement') or {}).get('actions') or []
+        for index, action in enumerate(actions):
+            if isinstance(action, dict) and 'target' in action and 'value' in action:
+                pinned.append((action, action['target'], action['value'], f"enforcement.actions[{index}]"))
+
+        return [
+            [platform, str(parameter), value, source]
+            for item, parameter, value, source in pinned
+            for platform in (_as_platforms(item.get('platform')) or policy_platforms or [ALL_PLATFORMS])
+        ]
+
+    def _read_policy(self):
+        """Read the raw policy file"""
+        if not os.path.exists(self.policy_file):
+            raise PolicyLoadError(f"Policy file not found: {self.policy_file}")
 
-    def _validate_disa_stig(self, policy_data):
-        """Validate DISA STIG compliance"""
-        findings = policy_data.get('compliance', {}).get('disa_stig', {}).get('findings', [])
+        try:
+            with open(self.policy_file, 'rb') as f:
+                return f.read()
+        except Exception as e:
+            raise PolicyLoadError(f"Failed to parse policy file: {str(e)}")
+
+    def _cache_key(self, content):
+        """Validation cache key of the policy content and every option affecting its result"""
+        # An inferred policy type can come from the name of the directory holding the policy
+        policy_dir = None
+        if self.policy_type is None:
+            policy_dir = os.path.basename(os.path.dirname(os.path.abspath(self.policy_file)))
+
+        return self.validation_cache.key(
+            content,
+            policy_type=self.policy_type,
+            policy_dir=policy_dir,
+            compliance_frameworks=self.compliance_frameworks,
+            strict_mode=self.strict_mode,
+            fourth_estate_mode=self.fourth_estate_mode,
+            schemas=self.schema_cache.fingerprint(),
+            nist_catalog=self.catalog.key if self.catalog else None,
+            stig_store=(os.path.abspath(self.stig_store_path), self.stig_store.revision()) if self.stig_store else None
+        )
+
+    def _parse_policy(self, content):
+        """Parse policy file content"""
+        try:
+            if self.policy_file.endswith('.json'):
+                policy_data = json.loads(content)
+            else:
+                policy_data = yaml.safe_load(content)
+        except Exception as e:
+            raise PolicyLoadError(f"Failed to parse policy file: {str(e)}")
+
+        if not isinstance(policy_data, dict):
+            raise PolicyLoadError(f"Policy file is not a policy definition mapping: {self.policy_file}")
+        return policy_data
+
+    def _infer_policy_type(self, policy_data):
+        """Policy type from the policy metadata or the directory holding it"""
+        metadata = policy_data.get('metadata') or {}
+        for candidate in (metadata.get('policy_type'), metadata.get('type'),
+                          os.path.basename(os.path.dirname(os.path.abspath(self.policy_file)))):
+            if candidate in POLICY_TYPES:
+                return candidate
+
+        self.warnings.append(ValidationIssue(
+            field='metadata.policy_type',
+            kind='warning',
+            message='Policy type could not be inferred - type specific rules were not applied',
+            severity='medium'
+        ))
+        return None
+
+    def _validate_schema(self, policy_data):
+        """Validate against schema_dir/<policy_type>.json, returning False when there is none"""
+        errors = self.schema_cache.errors(self.policy_type, policy_data)
+        if errors is None:
+            return False
+
+        for path, message in errors:
+            self.errors.append(ValidationIssue(
+                field=path,
+                kind='error',
+                message=message,
+                severity='high'
+            ))
+        return True
+
+def validate_policy_file(policy_file, options):
+    """Validate one policy file without a module, for batch workers"""
+    validator = PolicyValidator(None, dict(options, policy_file=policy_file))
+    try:
+        result = validator.validate_policy()
+    except Exception as e:
+        return {'policy_file': policy_file, 'policy_type': validator.policy_type, 'valid': False, 'error': str(e)}
+
+    del result['changed']
+    return dict(result, policy_file=policy_file, policy_type=validator.policy_type, settings=validator.settings)
+
+def _as_platforms(value):
+    """Platform list of a platform or platforms field"""
+    if not value:
+        return []
+    return [str(platform) for platform in value] if isinstance(value, list) else [str(value)]
+
+def _value_key(value):
+    """Comparison key of a pinned value; scalars compare as strings ('900' == 900)"""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return str(value)
+
+class ConflictIndex:
+    """Pinned policy values indexed by parameter and platform, checked in one pass
+
+    Settings for all platforms are merged into every platform-specific group of
+    the same parameter; a platform group is only reported when its own
+    settings add to what the all-platforms group already reports.
+    """
+
+    def __init__(self):
+        self.index = {}
+
+    def add(self, policy_file, settings):
+        """Index the settings of one policy file"""
+        for platform, parameter, value, source in settings:
+            values = self.index.setdefault(parameter, {}).setdefault(platform, {})
+            entry = values.setdefault(_value_key(value), {'value': value, 'policies': []})
+            entry['policies'].append({'policy_file': policy_file, 'source': source})
+
+    def report(self):
+        """Conflicting and redundant settings, sorted by parameter and platform"""
+        conflicts = []
+        redundancies = []
+        for parameter in sorted(self.index):
+            platforms = self.index[parameter]
+            shared = platforms.get(ALL_PLATFORMS, {})
+            for platform in sorted(platforms):
+                values = platforms[platform]
+                baseline = 1
+                if platform != ALL_PLATFORMS:
+                    values = self._merge(values, shared)
+                    # Conflicts among the all-platforms settings alone are reported under ALL_PLATFORMS
+                    baseline = max(1, len(shared))
+
+                if len(values) > baseline:
+                    conflicts.append({
+                        'platform': platform,
+                        'parameter': parameter,
+                        'values': [
+                            {'value': entry['value'], 'policies': entry['policies']} for entry in values.values()
+                        ]
+                    })
+                    continue
+                if len(values) > 1:
+                    continue
+
+                for key, entry in values.items():
+                    policy_files = list(dict.fromkeys(policy['policy_file'] for policy in entry['policies']))
+                    own = platform == ALL_PLATFORMS or key in platforms[platform]
+                    if len(policy_files) > 1 and own:
+                        redundancies.append({
+                            'platform': platform,
+                            'parameter': parameter,
+                            'value': entry['value'],
+                            'policy_files': policy_files
+                        })
+        return conflicts, redundancies
+
+    def _merge(self, values, shared):
+        merged = {key: {'value': entry['value'], 'policies': list(entry['policies'])} for key, entry in values.items()}
+        for key, entry in shared.items():
+            merged.setdefault(key, {'value': entry['value'], 'policies': []})['policies'].extend(entry['policies'])
+        return merged
+
+class PolicyBatchValidator:
+    """Validates a library of policy files in one invocation"""
 
-        self.compliance_status['disa_stig'] = {
-            'compliant': len(findings) > 0,
-            'findings_addressed': findings
-        }
+    def __init__(self, module):
+        self.module = module
+        self.policy_dir = module.params['policy_dir']
+        self.policy_glob = module.params['policy_glob']
+        self.max_workers = module.params['max_workers'] or os.cpu_count() or 1
+        self.detect_conflicts = module.params['detect_conflicts']
+        self.strict_mode = module.params['strict_mode']
+        self.options = {option: module.params[option] for option in VALIDATION_OPTIONS}
 
-        if len(findings) == 0:
-            self.warnings.append({
-                'field': 'compliance.disa_stig.findings',
-                'warning': 'No DISA STIG findings mapped',
-                'severity': 'medium'
-            })
+    def validate(self):
+        """Validate every discovered policy file and aggregate the results"""
+        policy_files = self._discover_policies()
+        if not policy_files:
+            self.module.fail_json(msg=f"No policy files found in {self.policy_dir or self.policy_glob}")
+
+        # Index the catalog once up front so workers only load the stored index
+        if self.options['nist_catalog'] and 'nist_800_53' in self.options['compliance_frameworks']:
+            try:
+                ControlCatalog.load(self.options['nist_catalog'], self.options['nist_profiles'],
+                                   self.options['catalog_cache_dir'])
+            except CatalogError as e:
+                self.module.fail_json(msg=str(e))
 
-    def _validate_iec_62443(self, policy_data):
-        """Validate IEC 62443 compliance (OT/ICS)"""
-        requirements = policy_data.get('compliance', {}).get('iec_62443', {}).get('requirements', [])
+        try:
+            results = self._validate_files(policy_files)
+        except Exception as e:
+            self.module.fail_json(msg=f"Validation failed: {str(e)}")
 
-        self.compliance_status['iec_62443'] = {
-            'compliant': len(requirements) > 0,
-            'requirements_met': requirements
+        conflict_index = ConflictIndex()
+        for result in results:
+            settings = result.pop('settings', None)
+            if self.detect_conflicts and settings:
+                conflict_index.add(result['policy_file'], settings)
+
+        summary = self._summarize(results)
+        batch = {
+            'valid': summary['invalid'] == 0,
+            'policies': results,
+            'summary': summary,
+            'changed': False
         }
-
-    def _validate_nerc_cip(self, policy_data):
-        """Validate NERC CIP compliance (Critical Infrastructure)"""
-        standards = policy_data.get('compliance', {}).get('nerc_cip', {}).get('standards', [])
-
-        self.compliance_status['nerc_cip'] = {
-            'compliant': len(standards) > 0,
-            'standards_met': standards
+        if self.detect_conflicts:
+            conflicts, redundancies = conflict_index.report()
+            summary['conflicts'] = len(conflicts)
+            summary['redundancies'] = len(redundancies)
+            if conflicts or (self.strict_mode and redundancies):
+                batch['valid'] = False
+            batch.update(conflicts=conflicts, redundancies=redundancies)
+        return batch
+
+    def _discover_policies(self):
+        """Sorted policy files below policy_dir or matching policy_glob"""
+        if self.policy_glob:
+            matches = glob.glob(self.policy_glob, recursive=True)
+        else:
+            matches = [
+                os.path.join(root, filename)
+                for root, _, filenames in os.walk(self.policy_dir)
+                for filename in filenames
+            ]
+        return sorted(path for path in matches if path.endswith(POLICY_EXTENSIONS) and os.path.isfile(path))
+
+    def _validate_files(self, policy_files):
+        """Validate files on a process pool, in-process for one worker or file"""
+        workers = min(self.max_workers, len(policy_files))
+        if workers <= 1:
+            return [validate_policy_file(policy_file, self.options) for policy_file in policy_files]
+
+        chunksize = max(1, len(policy_files) // (workers * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(validate_policy_file, policy_files, repeat(self.options), chunksize=chunksize))
+        except (BrokenProcessPool, OSError) as e:
+            self.module.warn(f"Process pool unavailable, validating in-process: {str(e)}")
+            return [validate_policy_file(policy_file, self.options) for policy_file in policy_files]
+
+    def _summarize(self, results):
+        """Aggregate counts across per-file results"""
+        by_type = {}
+        for result in results:
+            policy_type = result['policy_type'] or 'unknown'
+            by_type[policy_type] = by_type.get(policy_type, 0) + 1
+
+        invalid = [result['policy_file'] for result in results if not result['valid']]
+        return {
+            'total': len(results),
+            'valid': len(results) - len(invalid),
+            'invalid': len(invalid),
+            'load_errors': sum(1 for result in results if 'error' in result),
+            'cached': sum(1 for result in results if result.get('cached')),
+            'errors': sum(len(result.get('validation_errors', [])) for result in results),
+            'warnings': sum(len(result.get('validation_warnings', [])) for result in results),
+            'by_type': by_type,
+            'invalid_files': invalid
         }
 
-    def _validate_fourth_estate(self, policy_data):
-        """Fourth Estate specific validation rules"""
-        metadata = policy_data.get('metadata', {})
-
-        # Fourth Estate policies should address source protection
-        if 'source_protection' not in policy_data.get('policy', {}):
-            self.warnings.append({
-                'field': 'policy.source_protection',
-                'warning': 'Fourth Estate policy should address source protection requirements',
-                'severity': 'high'
-            })
-
-        # Critical severity policies require dual approval
-        if metadata.get('severity') == 'critical':
-            approval = policy_data.get('approval', {})
-            if approval.get('required_approvers', 0) < 2:
-                self.errors.append({
-                    'field': 'approval.required_approvers',
-                    'error': 'Critical severity policies require at least 2 approvers',
-                    'severity': 'high'
-                })
-
 def main():
     module = AnsibleModule(
         argument_spec=dict(
-            policy_file=dict(type='path', required=True),
-            policy_type=dict(type='str', required=True, choices=[
-                'security', 'compliance', 'network', 'access',
-                'data', 'backup', 'monitoring', 'change'
-            ]),
+            policy_file=dict(type='path', required=False),
+            policy_dir=dict(type='path', required=False),
+            policy_glob=dict(type='str', required=False),
+            max_workers=dict(type='int', required=False),
+            detect_conflicts=dict(type='bool', required=False, default=True),
+            policy_type=dict(type='str', required=False, choices=POLICY_TYPES),
             schema_dir=dict(type='path', required=False, default='/etc/policy_as_code/schemas'),
+            schema_cache_dir=dict(type='path', required=False, default='/var/lib/policy_as_code/schema_cache'),
+            validation_cache_dir=dict(type='path', required=False, default='/var/lib/policy_as_code/validation_cache'),
+            nist_catalog=dict(type='path', required=False),
+            nist_profiles=dict(type='list', elements='path', required=False),
+            catalog_cache_dir=dict(type='path', required=False, default='/var/lib/policy_as_code/catalog_cache'),
+            stig_store=dict(type='path', required=False),
             compliance_frameworks=dict(type='list', elements='str', required=False,
                                       default=['nist_800_53', 'disa_stig']),
             strict_mode=dict(type='bool', required=False, default=False),
             fourth_estate_mode=dict(type='bool', required=False, default=True)
         ),
+        mutually_exclusive=[('policy_file', 'policy_dir', 'policy_glob')],
+        required_one_of=[('policy_file', 'policy_dir', 'policy_glob')],
         supports_check_mode=True
     )
 
-    validator = PolicyValidator(module)
+    if module.params['max_workers'] is not None and module.params['max_workers'] < 1:
+        module.fail_json(msg="max_workers must be at least 1")
+    if module.params['policy_dir'] and not os.path.isdir(module.params['policy_dir']):
+        module.fail_json(msg=f"policy_dir {module.params['policy_dir']} is not a directory")
+    if module.params['stig_store'] and not os.path.isfile(module.params['stig_store']):
+        module.fail_json(msg=f"STIG store {module.params['stig_store']} not found - build it with stig_ingest")
+    if not HAS_JSONSCHEMA and has_schemas(module.params['schema_dir']):
+        module.fail_json(msg=missing_required_lib('jsonschema'), exception=JSONSCHEMA_IMPORT_ERROR)
+
+    if module.params['policy_file']:
+        validator = PolicyValidator(module)
+    else:
+        validator = PolicyBatchValidator(module)
     result = validator.validate()
 
     if result['valid']:
@@ -159,6 +159,7 @@ import os
 import yaml
 import time
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.compliance_records import RemediationResult
 from datetime import datetime
 
 class RemediationEngine:
@@ -223,8 +224,8 @@ class RemediationEngine:
                 validation_results = self._validate_remediations()
 
             # Calculate summary
-            successful = sum(1 for r in self.remediation_results if r['status'] == 'success')
-            failed = sum(1 for r in self.remediation_results if r['status'] == 'failed')
+            successful = sum(1 for r in self.remediation_results if r.status == 'success')
+            failed = sum(1 for r in self.remediation_results if r.status == 'failed')
             attempted = len(self.remediation_results)
 
             return {
@@ -232,7 +233,7 @@ class RemediationEngine:
                 'remediations_attempted': attempted,
                 'remediations_successful': successful,
                 'remediations_failed': failed,
-                'remediation_results': self.remediation_results,
+                'remediation_results': [r.to_dict() for r in self.remediation_results],
                 'backup_created': self.backup_path is not None,
                 'backup_path': self.backup_path,
                 'validation_results': validation_results,
@@ -276,17 +277,12 @@ class RemediationEngine:
         """Remediate a single violation"""
         start_time = time.time()
 
-        result = {
-            'violation_id': violation.get('violation_id', violation.get('requirement_id', 'unknown')),
-            'parameter': violation.get('parameter', 'unknown'),
-            'severity': violation.get('severity', 'unknown'),
-            'status': 'pending',
-            'action_taken': None,
-            'before_value': violation.get('actual', violation.get('current_value')),
-            'after_value': None,
-            'error': None,
-            'duration': 0.0
-        }
+        result = RemediationResult(
+            violation_id=violation.get('violation_id', violation.get('requirement_id', 'unknown')),
+            parameter=violation.get('parameter', 'unknown'),
+            severity=violation.get('severity', 'unknown'),
+            before_value=violation.get('actual', violation.get('current_value'))
+        )
 
         try:
             # Determine remediation strategy
@@ -294,32 +290,32 @@ class RemediationEngine:
 
             # Execute remediation based on strategy
             if strategy == 'configure':
-                result['action_taken'] = self._configure_parameter(violation)
-                result['after_value'] = violation.get('expected', violation.get('expected_value'))
-                result['status'] = 'success'
+                result.action_taken = self._configure_parameter(violation)
+                result.after_value = violation.get('expected', violation.get('expected_value'))
+                result.set_status('success')
 
             elif strategy == 'script':
-                result['action_taken'] = self._execute_remediation_script(violation)
-                result['status'] = 'success'
+                result.action_taken = self._execute_remediation_script(violation)
+                result.set_status('success')
 
             elif strategy == 'playbook':
-                result['action_taken'] = self._execute_remediation_playbook(violation)
-                result['status'] = 'success'
+                result.action_taken = self._execute_remediation_playbook(violation)
+                result.set_status('success')
 
             elif strategy == 'manual':
-                result['action_taken'] = 'Manual remediation required'
-                result['status'] = 'manual_required'
-                result['instructions'] = violation.get('remediation', 'No instructions provided')
+                result.action_taken = 'Manual remediation required'
+                result.set_status('manual_required')
+                result.instructions = violation.get('remediation', 'No instructions provided')
 
             else:
-                result['status'] = 'unknown_strategy'
-                result['error'] = f"Unknown remediation strategy: {strategy}"
+                result.set_status('unknown_strategy')
+                result.error = f"Unknown remediation strategy: {strategy}"
 
         except Exception as e:
-            result['status'] = 'failed'
-            result['error'] = str(e)
+            result.set_status('failed')
+            result.error = str(e)
 
-        result['duration'] = round(time.time() - start_time, 2)
+        result.duration = round(time.time() - start_time, 2)
         return result
 
     def _get_remediation_strategy(self, violation):
@@ -398,13 +394,13 @@ class RemediationEngine:
         failed = 0
 
         for result in self.remediation_results:
-            if result['status'] == 'success':
+            if result.status == 'success':
                 # Verify the configuration actually changed
                 if self._verify_remediation(result):
                     passed += 1
                 else:
                     failed += 1
-                    result['validation_error'] = 'Configuration did not change as expected'
+                    result.validation_error = 'Configuration did not change as expected'
 
         return {
             'validated': True,
@@ -0,0 +1,172 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Fourth Estate Policy as Code Framework
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: stig_ingest
+short_description: Ingest DISA STIG benchmarks and checklists into an indexed finding store
+description:
+  - Streams DISA STIG XCCDF benchmarks, CKL checklists and zip bundles of
+    them into an SQLite finding store keyed by vulnerability ID (V-ID)
+  - Each finding records its rule, STIG ID, title, severity and CAT
+    category, check text, fix text and CCIs
+  - Files are parsed incrementally and every finding is discarded from
+    memory once stored, so multi-hundred-megabyte bundles load in bounded
+    memory
+  - The store is read by the I(stig_store) option of M(policy_validator)
+    and M(compliance_checker)
+  - Re-ingesting a benchmark replaces all of its findings
+  - Files unchanged since their last ingest, by size and modification time
+    or else by content hash, are skipped and leave the store untouched
+version_added: "1.0.0"
+options:
+  stig_files:
+    description:
+      - XCCDF (C(.xml)), checklist (C(.ckl)) or bundle (C(.zip)) files to ingest
+      - One of I(stig_files) or I(stig_dir) is required
+    required: false
+    type: list
+    elements: path
+  stig_dir:
+    description:
+      - Ingest every C(.xml), C(.ckl) and C(.zip) file below this directory
+    required: false
+    type: path
+  stig_store:
+    description:
+      - SQLite finding store to create or update
+    required: true
+    type: path
+author:
+  - Fourth Estate Policy Team
+'''
+
+EXAMPLES = r'''
+- name: Ingest the RHEL 8 STIG benchmark
+  stig_ingest:
+    stig_files:
+      - /opt/stigs/U_RHEL_8_STIG_V1R12_Manual-xccdf.xml
+    stig_store: /var/lib/policy_as_code/stig.db
+
+- name: Ingest a quarterly STIG library bundle directory
+  stig_ingest:
+    stig_dir: /opt/stigs/2026_Q3
+    stig_store: /var/lib/policy_as_code/stig.db
+'''
+
+RETURN = r'''
+ingested:
+  description: Benchmarks and finding counts read from each file
+  returned: always
+  type: list
+  elements: dict
+  sample:
+    - source: /opt/stigs/U_RHEL_8_STIG_V1R12_Manual-xccdf.xml
+      benchmarks: ['RHEL_8_STIG']
+      findings: 366
+      changed: true
+findings:
+  description: Total findings held for the given files, including skipped unchanged files
+  returned: always
+  type: int
+  sample: 366
+benchmarks:
+  description: Benchmarks held by the store after ingestion
+  returned: unless in check mode
+  type: list
+  elements: dict
+  sample:
+    - name: RHEL_8_STIG
+      title: Red Hat Enterprise Linux 8 Security Technical Implementation Guide
+      version: '1'
+      release: 'Release: 12 Benchmark Date: 25 Oct 2023'
+      source: /opt/stigs/U_RHEL_8_STIG_V1R12_Manual-xccdf.xml
+      ingested: '2026-10-19T04:50:12'
+      findings: 366
+'''
+
+import os
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.stig_store import STIG_EXTENSIONS, StigFormatError, StigStore, iter_stig_file
+
+def discover_stig_files(stig_dir):
+    """Sorted STIG files below a directory"""
+    return sorted(
+        os.path.join(root, filename)
+        for root, _, filenames in os.walk(stig_dir)
+        for filename in filenames
+        if filename.lower().endswith(STIG_EXTENSIONS)
+    )
+
+def count_findings(path):
+    """Benchmarks and findings a file would ingest, without writing the store"""
+    benchmarks = []
+    count = 0
+    for kind, item in iter_stig_file(path):
+        if kind == 'benchmark':
+            benchmarks.append(item['name'])
+        else:
+            count += 1
+    return {'source': path, 'benchmarks': benchmarks, 'findings': count, 'changed': True}
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            stig_files=dict(type='list', elements='path', required=False),
+            stig_dir=dict(type='path', required=False),
+            stig_store=dict(type='path', required=True)
+        ),
+        mutually_exclusive=[('stig_files', 'stig_dir')],
+        required_one_of=[('stig_files', 'stig_dir')],
+        supports_check_mode=True
+    )
+
+    if module.params['stig_dir']:
+        if not os.path.isdir(module.params['stig_dir']):
+            module.fail_json(msg=f"stig_dir {module.params['stig_dir']} is not a directory")
+        stig_files = discover_stig_files(module.params['stig_dir'])
+    else:
+        stig_files = module.params['stig_files']
+    missing = [path for path in stig_files if not os.path.isfile(path)]
+    if missing:
+        module.fail_json(msg=f"STIG files not found: {', '.join(missing)}")
+
+    ingested = []
+    benchmarks = None
+    try:
+        if module.check_mode:
+            store = StigStore(module.params['stig_store'], read_only=True) \
+                if os.path.isfile(module.params['stig_store']) else None
+            try:
+                for path in stig_files:
+                    ingested.append((store.current(path) if store else None) or count_findings(path))
+            finally:
+                if store is not None:
+                    store.close()
+        else:
+            store = StigStore(module.params['stig_store'])
+            try:
+                for path in stig_files:
+                    ingested.append(store.ingest(path))
+                benchmarks = store.benchmarks()
+            finally:
+                store.close()
+    except StigFormatError as e:
+        module.fail_json(msg=str(e), ingested=ingested)
+    except Exception as e:
+        module.fail_json(msg=f"STIG ingestion failed: {str(e)}", ingested=ingested)
+
+    findings = sum(item['findings'] for item in ingested)
+    result = {'changed': any(item['changed'] for item in ingested), 'ingested': ingested, 'findings': findings}
+    if benchmarks is not None:
+        result['benchmarks'] = benchmarks
+    module.exit_json(**result)
+
+if __name__ == '__main__':
+    main()
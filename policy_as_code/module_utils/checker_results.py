@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Fourth Estate Policy as Code Framework
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Reader of compliance_checker results registered in a play or saved per host"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+import os
+
+def iter_checker_results(results, results_dir, warn):
+    """Yield per-host checker results from the play or the *.json files of a results directory
+
+    Files are read one at a time in name order. A file that cannot be read is
+    reported through warn(msg) and yielded as None, which callers count as a
+    skipped result.
+    """
+    if results is not None:
+        yield from results
+        return
+
+    for filename in sorted(os.listdir(results_dir)):
+        if not filename.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(results_dir, filename), 'r') as f:
+                yield json.load(f)
+        except (IOError, ValueError) as e:
+            warn(f"Failed to load result {filename}: {str(e)}")
+            yield None
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Fourth Estate Policy as Code Framework
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Compact finding records shared by the policy engines
+
+Records use __slots__ instead of per-finding dicts, and intern the small set
+of severity, category and status strings so every finding shares one copy.
+to_dict() produces the JSON shape the modules have always returned.
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from sys import intern
+
+def _intern(value):
+    return intern(value) if isinstance(value, str) else value
+
+class Record:
+    """Base for slotted records; fields in OPTIONAL are omitted while None"""
+    __slots__ = ()
+    OPTIONAL = ()
+
+    def to_dict(self):
+        data = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is None and name in self.OPTIONAL:
+                continue
+            data[name] = value
+        return data
+
+class Violation(Record):
+    """Failed policy requirement found by the compliance checker"""
+    __slots__ = ('policy', 'requirement_id', 'check_id', 'description', 'severity', 'finding', 'remediation', 'impact')
+
+    def __init__(self, policy, requirement_id, check_id, description, severity, finding, remediation, impact):
+        self.policy = policy
+        self.requirement_id = requirement_id
+        self.check_id = check_id
+        self.description = description
+        self.severity = _intern(severity)
+        self.finding = finding
+        self.remediation = remediation
+        self.impact = impact
+
+class DriftItem(Record):
+    """Parameter whose current value differs from the baseline"""
+    __slots__ = ('parameter', 'expected', 'actual', 'severity', 'category', 'detected_at', 'note')
+    OPTIONAL = ('note',)
+
+    def __init__(self, parameter, expected, actual, severity, category, detected_at, note=None):
+        self.parameter = parameter
+        self.expected = expected
+        self.actual = actual
+        self.severity = _intern(severity)
+        self.category = _intern(category)
+        self.detected_at = detected_at
+        self.note = note
+
+class RemediationResult(Record):
+    """Outcome of remediating one violation"""
+    __slots__ = ('violation_id', 'parameter', 'severity', 'status', 'action_taken', 'before_value',
+                 'after_value', 'error', 'duration', 'instructions', 'validation_error')
+    OPTIONAL = ('instructions', 'validation_error')
+
+    def __init__(self, violation_id, parameter, severity, before_value, status='pending'):
+        self.violation_id = violation_id
+        self.parameter = parameter
+        self.severity = _intern(severity)
+        self.status = _intern(status)
+        self.action_taken = None
+        self.before_value = before_value
+        self.after_value = None
+        self.error = None
+        self.duration = 0.0
+        self.instructions = None
+        self.validation_error = None
+
+    def set_status(self, status):
+        self.status = _intern(status)
+
+class EnforcementChange(Record):
+    """Configuration change proposed or applied by the policy enforcer"""
+    __slots__ = ('action', 'target', 'description', 'expected_value', 'current_value', 'applied', 'applied_at')
+    OPTIONAL = ('applied', 'applied_at')
+
+    def __init__(self, action, target, description, expected_value, current_value):
+        self.action = _intern(action)
+        self.target = target
+        self.description = description
+        self.expected_value = expected_value
+        self.current_value = current_value
+        self.applied = None
+        self.applied_at = None
+
+class ValidationIssue(Record):
+    """Policy validation error or warning, reported under an 'error' or 'warning' key"""
+    __slots__ = ('field', 'kind', 'message', 'severity')
+
+    def __init__(self, field, kind, message, severity):
+        self.field = field
+        self.kind = _intern(kind)
+        self.message = message
+        self.severity = _intern(severity)
+
+    def to_dict(self):
+        return {'field': self.field, self.kind: self.message, 'severity': self.severity}
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Fourth Estate Policy as Code Framework
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""SQLite compliance results history shared by the compliance modules"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import os
+import sqlite3
+
+# Stored outcome codes; timed out controls are not recorded since they say nothing new
+OUTCOME_CODES = {'failed': 0, 'passed': 1}
+OUTCOME_NAMES = {code: name for name, code in OUTCOME_CODES.items()}
+
+# Outcomes are stored as a change log: a run only adds rows for controls whose
+# outcome differs from the host's previous run, and every other control of the
+# run refers back to the run that last changed it through host_controls
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS hosts (
+    host_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    platform TEXT
+);
+CREATE TABLE IF NOT EXISTS controls (
+    control_id INTEGER PRIMARY KEY,
+    framework TEXT NOT NULL,
+    control TEXT NOT NULL,
+    UNIQUE (framework, control)
+);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    host_id INTEGER NOT NULL REFERENCES hosts (host_id),
+    started TEXT NOT NULL,
+    score REAL,
+    total_checks INTEGER,
+    failed_checks INTEGER,
+    changed_controls INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_host ON runs (host_id, started);
+CREATE INDEX IF NOT EXISTS runs_started ON runs (started);
+CREATE TABLE IF NOT EXISTS outcome_changes (
+    host_id INTEGER NOT NULL,
+    control_id INTEGER NOT NULL,
+    run_id INTEGER NOT NULL,
+    outcome INTEGER NOT NULL,
+    severity TEXT,
+    previous_outcome INTEGER,
+    previous_run_id INTEGER,
+    PRIMARY KEY (host_id, control_id, run_id)
+);
+CREATE INDEX IF NOT EXISTS outcome_changes_run ON outcome_changes (run_id, outcome);
+CREATE INDEX IF NOT EXISTS outcome_changes_control ON outcome_changes (control_id, run_id);
+CREATE TABLE IF NOT EXISTS host_controls (
+    host_id INTEGER NOT NULL,
+    control_id INTEGER NOT NULL,
+    outcome INTEGER NOT NULL,
+    severity TEXT,
+    since_run_id INTEGER NOT NULL,
+    last_run_id INTEGER NOT NULL,
+    PRIMARY KEY (host_id, control_id)
+);
+CREATE INDEX IF NOT EXISTS host_controls_outcome ON host_controls (outcome, control_id);
+'''
+
+class ComplianceStore:
+    """Indexed SQLite store of compliance run outcomes"""
+
+    def __init__(self, path, timeout=30.0):
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        self.connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def record_run(self, host, platform, started, summary, control_outcomes):
+        """Record a run, storing only outcomes that changed since the host's previous run"""
+        cursor = self.connection.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            cursor.execute(
+                'INSERT INTO hosts (name, platform) VALUES (?, ?) '
+                'ON CONFLICT (name) DO UPDATE SET platform = excluded.platform',
+                (host, platform)
+            )
+            host_id = cursor.execute('SELECT host_id FROM hosts WHERE name = ?', (host,)).fetchone()[0]
+            cursor.execute(
+                'INSERT INTO runs (host_id, started, score, total_checks, failed_checks) VALUES (?, ?, ?, ?, ?)',
+                (host_id, started, summary.get('compliance_score'),
+                 summary.get('total_checks'), summary.get('failed_checks'))
+            )
+            run_id = cursor.lastrowid
+
+            control_ids = self._control_ids(cursor, control_outcomes)
+            previous = {
+                row['control_id']: (row['outcome'], row['since_run_id'])
+                for row in cursor.execute(
+                    'SELECT control_id, outcome, since_run_id FROM host_controls WHERE host_id = ?', (host_id,)
+                )
+            }
+
+            changes = []
+            unchanged = []
+            for item in control_outcomes:
+                outcome = OUTCOME_CODES.get(item.get('outcome'))
+                if outcome is None:
+                    continue
+                control_id = control_ids[(item['framework'], item['control'])]
+                previous_outcome, previous_run_id = previous.get(control_id, (None, None))
+                if outcome == previous_outcome:
+                    unchanged.append((run_id, host_id, control_id))
+                else:
+                    changes.append((host_id, control_id, run_id, outcome, item.get('severity'),
+                                    previous_outcome, previous_run_id))
+
+            cursor.executemany(
+                'INSERT INTO outcome_changes (host_id, control_id, run_id, outcome, severity, '
+                'previous_outcome, previous_run_id) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                changes
+            )
+            cursor.executemany(
+                'INSERT INTO host_controls (host_id, control_id, outcome, severity, since_run_id, last_run_id) '
+                'VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (host_id, control_id) DO UPDATE SET '
+                'outcome = excluded.outcome, severity = excluded.severity, '
+                'since_run_id = excluded.since_run_id, last_run_id = excluded.last_run_id',
+                [(host_id, control_id, outcome, severity, run_id, run_id)
+                 for host_id, control_id, run_id, outcome, severity, _, _ in changes]
+            )
+            cursor.executemany(
+                'UPDATE host_controls SET last_run_id = ? WHERE host_id = ? AND control_id = ?',
+                unchanged
+            )
+            cursor.execute('UPDATE runs SET changed_controls = ? WHERE run_id = ?', (len(changes), run_id))
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+
+        return {'run_id': run_id, 'changed_controls': len(changes), 'unchanged_controls': len(unchanged)}
+
+    def _control_ids(self, cursor, control_outcomes):
+        """Map (framework, control) to control ids, creating unknown controls"""
+        keys = set((item['framework'], item['control']) for item in control_outcomes)
+        cursor.executemany('INSERT OR IGNORE INTO controls (framework, control) VALUES (?, ?)', keys)
+        return {
+            (row['framework'], row['control']): row['control_id']
+            for row in cursor.execute('SELECT control_id, framework, control FROM controls')
+            if (row['framework'], row['control']) in keys
+        }
+
+    def _filters(self, hosts, frameworks):
+        """SQL conditions and parameters restricting hosts and frameworks"""
+        conditions = []
+        params = []
+        if hosts:
+            conditions.append(f"h.name IN ({', '.join('?' * len(hosts))})")
+            params.extend(hosts)
+        if frameworks:
+            conditions.append(f"c.framework IN ({', '.join('?' * len(frameworks))})")
+            params.extend(frameworks)
+        return ''.join(f" AND {condition}" for condition in conditions), params
+
+    def regressions(self, since, hosts=None, frameworks=None, limit=None):
+        """Controls that changed from passed to failed in runs started since a time"""
+        conditions, params = self._filters(hosts, frameworks)
+        rows = self.connection.execute(
+            'SELECT h.name AS host, c.framework, c.control, oc.severity, r.started AS regressed, '
+            'p.started AS passing_since '
+            'FROM runs r '
+            'JOIN outcome_changes oc ON oc.run_id = r.run_id '
+            'JOIN hosts h ON h.host_id = oc.host_id '
+            'JOIN controls c ON c.control_id = oc.control_id '
+            'LEFT JOIN runs p ON p.run_id = oc.previous_run_id '
+            f"WHERE r.started >= ? AND oc.outcome = 0 AND oc.previous_outcome = 1{conditions} "
+            'ORDER BY r.started DESC LIMIT ?',
+            [since] + params + [limit if limit is not None else -1]
+        )
+        return [dict(row) for row in rows]
+
+    def time_to_remediate(self, since, hosts=None, frameworks=None, limit=None):
+        """Per-control time from failure to the run that found it passing again"""
+        conditions, params = self._filters(hosts, frameworks)
+        rows = self.connection.execute(
+            'SELECT c.framework, c.control, COUNT(*) AS remediations, '
+            'AVG(julianday(r.started) - julianday(f.started)) * 24 AS mean_hours, '
+            'MAX(julianday(r.started) - julianday(f.started)) * 24 AS max_hours '
+            'FROM runs r '
+            'JOIN outcome_changes oc ON oc.run_id = r.run_id '
+            'JOIN runs f ON f.run_id = oc.previous_run_id '
+            'JOIN hosts h ON h.host_id = oc.host_id '
+            'JOIN controls c ON c.control_id = oc.control_id '
+            f"WHERE r.started >= ? AND oc.outcome = 1 AND oc.previous_outcome = 0{conditions} "
+            'GROUP BY oc.control_id ORDER BY mean_hours DESC LIMIT ?',
+            [since] + params + [limit if limit is not None else -1]
+        )
+        return [
+            dict(row, mean_hours=round(row['mean_hours'], 2), max_hours=round(row['max_hours'], 2))
+            for row in rows
+        ]
+
+    def open_failures(self, since, hosts=None, frameworks=None, limit=None):
+        """Controls failing on their latest run, with when each failure started"""
+        conditions, params = self._filters(hosts, frameworks)
+        rows = self.connection.execute(
+            'SELECT h.name AS host, c.framework, c.control, hc.severity, f.started AS failing_since, '
+            'l.started AS last_checked '
+            'FROM host_controls hc '
+            'JOIN hosts h ON h.host_id = hc.host_id '
+            'JOIN controls c ON c.control_id = hc.control_id '
+            'JOIN runs f ON f.run_id = hc.since_run_id '
+            'JOIN runs l ON l.run_id = hc.last_run_id '
+            f"WHERE hc.outcome = 0 AND l.started >= ?{conditions} "
+            'ORDER BY f.started LIMIT ?',
+            [since] + params + [limit if limit is not None else -1]
+        )
+        return [dict(row) for row in rows]
+
+    def latest_outcomes(self, hosts=None, frameworks=None):
+        """Yield the latest outcome of every control of every host, grouped by host"""
+        conditions, params = self._filters(hosts, frameworks)
+        rows = self.connection.execute(
+            'SELECT h.name AS host, h.platform, c.framework, c.control, hc.outcome, hc.severity, '
+            'l.started AS last_checked '
+            'FROM host_controls hc '
+            'JOIN hosts h ON h.host_id = hc.host_id '
+            'JOIN controls c ON c.control_id = hc.control_id '
+            'JOIN runs l ON l.run_id = hc.last_run_id '
+            f"WHERE hc.outcome IN (0, 1){conditions} "
+            'ORDER BY hc.host_id, hc.control_id',
+            params
+        )
+        for row in rows:
+            yield dict(row, outcome=OUTCOME_NAMES[row['outcome']])
+
+    def outcomes_at(self, run_id):
+        """Every control outcome of a run, resolved through the change log"""
+        rows = self.connection.execute(
+            'SELECT c.framework, c.control, oc.outcome, oc.severity '
+            'FROM runs r '
+            'JOIN outcome_changes oc ON oc.host_id = r.host_id AND oc.run_id <= r.run_id '
+            'JOIN controls c ON c.control_id = oc.control_id '
+            'WHERE r.run_id = ? AND oc.run_id = ('
+            '  SELECT MAX(latest.run_id) FROM outcome_changes latest '
+            '  WHERE latest.host_id = oc.host_id AND latest.control_id = oc.control_id '
+            '  AND latest.run_id <= r.run_id)',
+            (run_id,)
+        )
+        return [
+            {'framework': row['framework'], 'control': row['control'],
+             'outcome': OUTCOME_NAMES[row['outcome']], 'severity': row['severity']}
+            for row in rows
+        ]
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Fourth Estate Policy as Code Framework
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Compact index of an OSCAL NIST 800-53 catalog for control ID lookups
+
+The OSCAL catalog and baseline profiles are parsed once into a small JSON
+index of control and enhancement IDs, their withdrawn status and baselines.
+The index is stored in cache_dir under a key of the source files' paths,
+sizes and modification times, and kept in memory per process, so validating
+a whole library parses the catalog at most once.
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import re
+
+INDEX_VERSION = 1
+
+# Bit flags of an indexed control; baseline i is bit BASELINE_SHIFT + i
+WITHDRAWN = 1
+BASELINE_SHIFT = 1
+
+CONTROL_ID = re.compile(r'^([a-z]{2})-0*(\d+)(?:\.0*(\d+)|\(0*(\d+)\))?$', re.IGNORECASE)
+BASELINE_NAME = re.compile(r'\b(LOW|MODERATE|HIGH|PRIVACY)\b', re.IGNORECASE)
+
+# Loaded indexes by index key
+_INDEXES = {}
+
+class CatalogError(Exception):
+    """Catalog or profile cannot be read or is not OSCAL"""
+
+def normalize_control_id(control):
+    """Canonical control ID ('ac-2.1' and 'AC-02 (1)' -> 'AC-2(1)'), or None when malformed"""
+    match = CONTROL_ID.match(str(control).strip().replace(' ', ''))
+    if not match:
+        return None
+    family, number, dotted, parenthesized = match.groups()
+    enhancement = dotted or parenthesized
+    return f"{family.upper()}-{number}({enhancement})" if enhancement else f"{family.upper()}-{number}"
+
+def _source_key(paths):
+    """Index key of the source files, changing whenever one of them does"""
+    sources = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            raise CatalogError(f"Failed to read {path}: {str(e)}")
+        sources.append([os.path.abspath(path), stat.st_size, stat.st_mtime_ns])
+    return hashlib.sha256(json.dumps([INDEX_VERSION, sources]).encode('utf-8')).hexdigest()[:32]
+
+def _load_json(path, root):
+    try:
+        with open(path, 'r') as f:
+            document = json.load(f)
+    except (OSError, ValueError) as e:
+        raise CatalogError(f"Failed to load {path}: {str(e)}")
+    if not isinstance(document, dict) or root not in document:
+        raise CatalogError(f"{path} is not an OSCAL {root}")
+    return document[root]
+
+def _walk_controls(node):
+    """Controls and enhancements below a catalog, group or control, depth first"""
+    for group in node.get('groups', []):
+        yield from _walk_controls(group)
+    for control in node.get('controls', []):
+        yield control
+        yield from _walk_controls(control)
+
+def _baseline_name(profile, path):
+    match = BASELINE_NAME.search((profile.get('metadata') or {}).get('title', ''))
+    return match.group(1).upper() if match else os.path.splitext(os.path.basename(path))[0]
+
+def build_index(catalog_path, profile_paths=()):
+    """Parse an OSCAL catalog and baseline profiles into the compact index"""
+    catalog = _load_json(catalog_path, 'catalog')
+    controls = {}
+    withdrawn = {}
+    for control in _walk_controls(catalog):
+        control_id = normalize_control_id(control.get('id', ''))
+        if control_id is None:
+            continue
+        props = {prop.get('name'): prop.get('value') for prop in control.get('props', [])}
+        flags = 0
+        if props.get('status') == 'withdrawn':
+            flags |= WITHDRAWN
+            withdrawn[control_id] = [
+                normalize_control_id(link['href'].lstrip('#'))
+                for link in control.get('links', [])
+                if link.get('rel') in ('incorporated-into', 'moved-to') and link.get('href', '').startswith('#')
+            ]
+        controls[control_id] = flags
+
+    baselines = []
+    for bit, path in enumerate(profile_paths):
+        profile = _load_json(path, 'profile')
+        baselines.append(_baseline_name(profile, path))
+        for source in profile.get('imports', []):
+            for selection in source.get('include-controls', []):
+                for included in selection.get('with-ids', []):
+                    control_id = normalize_control_id(included)
+                    if control_id in controls:
+                        controls[control_id] |= 1 << (BASELINE_SHIFT + bit)
+
+    return {
+        'version': INDEX_VERSION,
+        'catalog': (catalog.get('metadata') or {}).get('title'),
+        'baselines': baselines,
+        'controls': controls,
+        'withdrawn': {control_id: [item for item in targets if item] for control_id, targets in withdrawn.items()}
+    }
+
+class ControlCatalog:
+    """O(1) control ID lookups against an indexed OSCAL catalog"""
+
+    def __init__(self, index, key):
+        self.key = key
+        self.title = index['catalog']
+        self.baselines = index['baselines']
+        self.controls = index['controls']
+        self.withdrawn = index['withdrawn']
+
+    @classmethod
+    def load(cls, catalog_path, profile_paths=(), cache_dir=None):
+        """Index from memory, then cache_dir, else parsed from the sources and stored"""
+        profile_paths = list(profile_paths or [])
+        key = _source_key([catalog_path] + profile_paths)
+        if key in _INDEXES:
+            return cls(_INDEXES[key], key)
+
+        index_path = os.path.join(cache_dir, f"nist_800_53_{key}.json") if cache_dir else None
+        index = None
+        if index_path and os.path.exists(index_path):
+            try:
+                with open(index_path, 'r') as f:
+                    index = json.load(f)
+            except (OSError, ValueError):
+                index = None
+
+        if index is None or index.get('version') != INDEX_VERSION:
+            index = build_index(catalog_path, profile_paths)
+            if index_path:
+                cls._store(index_path, index)
+
+        _INDEXES[key] = index
+        return cls(index, key)
+
+    @staticmethod
+    def _store(index_path, index):
+        """Write the index atomically; the cache is best effort and never fails validation"""
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            tmp_file = f"{index_path}.{os.getpid()}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(index, f, separators=(',', ':'))
+            os.replace(tmp_file, index_path)
+        except OSError:
+            pass
+
+    def lookup(self, control):
+        """(canonical ID, flags) of a control; flags is None when the catalog lacks it"""
+        control_id = normalize_control_id(control)
+        return control_id, self.controls.get(control_id) if control_id else None
+
+    def control_baselines(self, flags):
+        """Names of the baselines a control's flags include"""
+        return [name for bit, name in enumerate(self.baselines) if flags & (1 << (BASELINE_SHIFT + bit))]
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Fourth Estate Policy as Code Framework
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Stable finding IDs and run-to-run finding diffs for diff-only results"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+
+FINDING_ID_LENGTH = 16
+
+def _canonical(value):
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+
+def finding_id(*identity):
+    """Stable identifier of a finding from the fields that identify it"""
+    return hashlib.sha256(_canonical(identity).encode('utf-8')).hexdigest()[:FINDING_ID_LENGTH]
+
+class FindingLedger:
+    """Findings recorded by a host's previous run, diffed against the current run"""
+
+    def __init__(self, path, scope, identity, volatile=()):
+        self.path = path
+        self.scope = scope
+        self.identity = tuple(identity)
+        self.volatile = frozenset(volatile)
+        self.previous = {}
+        self.current = {}
+
+    def load(self):
+        """Load the previous run's findings; a missing ledger makes every finding new"""
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                self.previous = json.load(f).get('findings', {})
+        return self.previous
+
+    def diff(self, findings, carry_forward=None):
+        """Split findings into new, changed and resolved, counting unchanged ones
+
+        carry_forward(summary) marks previous findings that were not re-evaluated
+        this run; they are kept in the ledger instead of being reported resolved.
+        """
+        new = []
+        changed = []
+        self.current = {}
+        for finding in findings:
+            summary = {key: finding.get(key) for key in self.identity}
+            fid = finding_id(self.scope, *summary.values())
+            digest = hashlib.sha256(_canonical(
+                {key: value for key, value in finding.items() if key not in self.volatile}
+            ).encode('utf-8')).hexdigest()
+            self.current[fid] = {'digest': digest, 'summary': summary}
+
+            previous = self.previous.get(fid)
+            if previous is None:
+                new.append(dict(finding, finding_id=fid))
+            elif previous['digest'] != digest:
+                changed.append(dict(finding, finding_id=fid))
+
+        resolved = []
+        for fid, entry in self.previous.items():
+            if fid in self.current:
+                continue
+            if carry_forward is not None and carry_forward(entry['summary']):
+                self.current[fid] = entry
+            else:
+                resolved.append(dict(entry['summary'], finding_id=fid))
+
+        return {
+            'new': new,
+            'changed': changed,
+            'resolved': resolved,
+            'unchanged': len(findings) - len(new) - len(changed)
+        }
+
+    def save(self):
+        """Atomically record the current run's findings"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_file = f"{self.path}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump({'scope': self.scope, 'findings': self.current}, f)
+        os.replace(tmp_file, self.path)
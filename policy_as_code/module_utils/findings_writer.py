@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Fourth Estate Policy as Code Framework
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Streaming JSONL writer for spilling large finding sets to disk"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+import os
+
+class FindingsWriter:
+    """Write findings one JSON object per line as they are produced
+
+    Findings go to a temporary file that replaces the target on close, so a
+    failed run never leaves a truncated findings file behind.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.tmp_path = f"{path}.tmp"
+        self.count = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.handle = open(self.tmp_path, 'w', encoding='utf-8')
+
+    def write(self, finding):
+        self.handle.write(json.dumps(finding, sort_keys=True, default=str))
+        self.handle.write('\n')
+        self.count += 1
+
+    def close(self):
+        """Finish the file and move it into place"""
+        self.handle.close()
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        """Discard a partially written file"""
+        self.handle.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Fourth Estate Policy as Code Framework
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Incremental writer of OSCAL assessment-results JSON
+
+Observations are written to the document as they are produced and findings
+are spilled to a side file that is appended when the document is closed, so
+memory stays bounded by the number of assessed hosts however many control
+outcomes are exported. The document goes to a temporary file that replaces
+the target on close, so a failed export never leaves a truncated file behind.
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+import os
+import shutil
+import uuid
+from ansible.module_utils.control_catalog import normalize_control_id
+from datetime import datetime
+
+OSCAL_VERSION = '1.1.2'
+
+# Finding states of evaluated outcomes; timed out controls only get an observation
+FINDING_STATES = {'passed': 'satisfied', 'failed': 'not-satisfied'}
+
+OUTCOME_TEXT = {'passed': 'passed', 'failed': 'failed', 'timed_out': 'could not be evaluated in time'}
+
+def oscal_timestamp(value=None):
+    """OSCAL date-time, with a UTC offset, of an ISO 8601 time; now when omitted"""
+    moment = datetime.fromisoformat(value) if value else datetime.now()
+    return (moment if moment.tzinfo else moment.astimezone()).isoformat(timespec='seconds')
+
+def oscal_target_id(framework, control):
+    """OSCAL target ID of a framework control ('AC-2(1)' -> 'ac-2.1' for NIST 800-53)"""
+    control_id = normalize_control_id(control) if framework == 'nist_800_53' else None
+    if control_id is None:
+        return str(control)
+    return control_id.lower().replace('(', '.').rstrip(')')
+
+def _dumps(item):
+    return json.dumps(item, separators=(',', ':'), default=str)
+
+class AssessmentResultsWriter:
+    """Stream one OSCAL assessment-results document with a single result"""
+
+    def __init__(self, path, title, version, assessment_plan, description):
+        self.path = path
+        self.tmp_path = f"{path}.tmp"
+        self.findings_path = f"{path}.findings.tmp"
+        self.subjects = {}
+        self.observations = 0
+        self.findings = 0
+        self.states = {state: 0 for state in FINDING_STATES.values()}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.handle = open(self.tmp_path, 'w', encoding='utf-8')
+        self.findings_handle = open(self.findings_path, 'w+', encoding='utf-8')
+
+        started = oscal_timestamp()
+        metadata = {'title': title, 'last-modified': started, 'version': version, 'oscal-version': OSCAL_VERSION}
+        result = {
+            'uuid': str(uuid.uuid4()),
+            'title': title,
+            'description': description,
+            'start': started,
+            'reviewed-controls': {'control-selections': [{'include-all': {}}]}
+        }
+        # The result object stays open so observations and findings can follow it
+        self.handle.write(
+            f'{{"assessment-results":{{"uuid":{_dumps(str(uuid.uuid4()))},"metadata":{_dumps(metadata)},'
+            f'"import-ap":{_dumps({"href": assessment_plan})},"results":[{_dumps(result)[:-1]}'
+        )
+
+    def observe(self, host, platform, framework, control, outcome, severity, collected):
+        """Write the observation of one control outcome on a host, and spill its finding"""
+        subject_uuid = self._subject(host, platform)
+        observation_uuid = str(uuid.uuid4())
+        description = f"{framework} control {control} {OUTCOME_TEXT.get(outcome, outcome)} on {host}"
+        if severity:
+            description += f" (severity {severity})"
+
+        self.handle.write(',' if self.observations else ',"observations":[')
+        self.handle.write(_dumps({
+            'uuid': observation_uuid,
+            'title': f"{control} on {host}",
+            'description': description,
+            'methods': ['TEST'],
+            'types': ['finding' if outcome == 'failed' else 'control-objective'],
+            'subjects': [{'subject-uuid': subject_uuid, 'type': 'inventory-item'}],
+            'collected': collected
+        }))
+        self.observations += 1
+
+        state = FINDING_STATES.get(outcome)
+        if state is None:
+            return
+        if self.findings:
+            self.findings_handle.write(',')
+        self.findings_handle.write(_dumps({
+            'uuid': str(uuid.uuid4()),
+            'title': f"{control} on {host}",
+            'description': description,
+            'target': {
+                'type': 'objective-id',
+                'target-id': oscal_target_id(framework, control),
+                'status': {'state': state}
+            },
+            'related-observations': [{'observation-uuid': observation_uuid}]
+        }))
+        self.findings += 1
+        self.states[state] += 1
+
+    def _subject(self, host, platform):
+        """Inventory item UUID of a host, assigned on first sight"""
+        subject = self.subjects.get(host)
+        if subject is None:
+            subject = self.subjects[host] = (str(uuid.uuid4()), platform)
+        return subject[0]
+
+    def close(self):
+        """Append the findings and assessed hosts, finish the document and move it into place"""
+        if self.observations:
+            self.handle.write(']')
+        if self.findings:
+            self.handle.write(',"findings":[')
+            self.findings_handle.seek(0)
+            shutil.copyfileobj(self.findings_handle, self.handle)
+            self.handle.write(']')
+        self.findings_handle.close()
+        os.remove(self.findings_path)
+
+        if self.subjects:
+            inventory = [
+                {
+                    'uuid': subject_uuid,
+                    'description': f"{host} ({platform})" if platform else host,
+                    'props': [{'name': 'asset-id', 'value': host}]
+                }
+                for host, (subject_uuid, platform) in self.subjects.items()
+            ]
+            self.handle.write(f',"local-definitions":{_dumps({"inventory-items": inventory})}')
+        self.handle.write(f',"end":{_dumps(oscal_timestamp())}}}]}}}}')
+        self.handle.close()
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        """Discard a partially written document"""
+        for handle, path in ((self.handle, self.tmp_path), (self.findings_handle, self.findings_path)):
+            handle.close()
+            if os.path.exists(path):
+                os.remove(path)
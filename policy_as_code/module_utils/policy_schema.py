@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Fourth Estate Policy as Code Framework
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""JSON Schema validation of policy documents with compiled validator caching
+
+Each policy type is validated against <schema_dir>/<policy_type>.json. Compiled
+validators are kept per process keyed by the schema's content hash, so a batch
+of policies compiles each schema once per worker. Schemas that passed the
+metaschema check are recorded in cache_dir by hash so later runs skip it.
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import traceback
+from datetime import datetime
+
+try:
+    from jsonschema.validators import validator_for
+    from jsonschema.exceptions import SchemaError
+    HAS_JSONSCHEMA = True
+    JSONSCHEMA_IMPORT_ERROR = None
+except ImportError:
+    HAS_JSONSCHEMA = False
+    JSONSCHEMA_IMPORT_ERROR = traceback.format_exc()
+
+# Compiled validators by schema hash, and schema hashes by (path, mtime, size)
+_VALIDATORS = {}
+_SCHEMA_HASHES = {}
+
+class PolicySchemaError(Exception):
+    """Schema file cannot be read, or is not a valid JSON Schema"""
+
+def has_schemas(schema_dir):
+    """Whether schema_dir holds any policy schema"""
+    return os.path.isdir(schema_dir) and any(name.endswith('.json') for name in os.listdir(schema_dir))
+
+def error_path(error):
+    """Dotted path of the policy field a schema error refers to, '$' for the document root
+
+    Missing required properties are reported at the path of the missing field.
+    """
+    parts = list(error.absolute_path)
+    if error.validator == 'required' and isinstance(error.instance, dict):
+        parts.extend(name for name in error.validator_value
+                     if name not in error.instance and error.message.startswith(f"{name!r} "))
+
+    path = ''
+    for part in parts:
+        if isinstance(part, int):
+            path += f"[{part}]"
+        else:
+            path += f".{part}" if path else str(part)
+    return path or '$'
+
+class SchemaCache:
+    """Compiled policy schemas from schema_dir, checked once per schema hash"""
+
+    def __init__(self, schema_dir, cache_dir=None):
+        self.schema_dir = schema_dir
+        self.cache_dir = cache_dir
+
+    def schema_path(self, policy_type):
+        """Schema file for a policy type, or None when schema_dir has none"""
+        if not policy_type or not self.schema_dir:
+            return None
+        path = os.path.join(self.schema_dir, f"{policy_type}.json")
+        return path if os.path.isfile(path) else None
+
+    def validator(self, policy_type):
+        """Compiled validator for a policy type, or None when it has no schema"""
+        path = self.schema_path(policy_type)
+        if path is None:
+            return None
+
+        schema_hash = self._schema_hash(path)
+        if schema_hash in _VALIDATORS:
+            return _VALIDATORS[schema_hash]
+
+        if not HAS_JSONSCHEMA:
+            raise PolicySchemaError(f"jsonschema is required to validate against {path}")
+
+        try:
+            with open(path, 'rb') as f:
+                schema = json.load(f)
+        except (OSError, ValueError) as e:
+            raise PolicySchemaError(f"Failed to load schema {path}: {str(e)}")
+
+        _VALIDATORS[schema_hash] = self._compile(path, schema, schema_hash)
+        return _VALIDATORS[schema_hash]
+
+    def _schema_hash(self, path):
+        """Content hash of a schema file, re-read only when its mtime or size changes"""
+        try:
+            stat = os.stat(path)
+            key = (path, stat.st_mtime_ns, stat.st_size)
+            if key not in _SCHEMA_HASHES:
+                with open(path, 'rb') as f:
+                    _SCHEMA_HASHES[key] = hashlib.sha256(f.read()).hexdigest()
+        except OSError as e:
+            raise PolicySchemaError(f"Failed to load schema {path}: {str(e)}")
+        return _SCHEMA_HASHES[key]
+
+    def fingerprint(self):
+        """Hashes of every schema in schema_dir, for keying results that depend on them"""
+        if not self.schema_dir or not os.path.isdir(self.schema_dir):
+            return {}
+        return {
+            name: self._schema_hash(os.path.join(self.schema_dir, name))
+            for name in sorted(os.listdir(self.schema_dir))
+            if name.endswith('.json') and os.path.isfile(os.path.join(self.schema_dir, name))
+        }
+
+    def _compile(self, path, schema, schema_hash):
+        """Build a validator, checking the schema unless cache_dir already vouches for it"""
+        cls = validator_for(schema)
+        marker = os.path.join(self.cache_dir, f"{schema_hash}.json") if self.cache_dir else None
+        if marker is None or not os.path.exists(marker):
+            try:
+                cls.check_schema(schema)
+            except SchemaError as e:
+                raise PolicySchemaError(f"Invalid schema {path}: {e.message}")
+            if marker is not None:
+                self._record_checked(marker, path, schema_hash, cls)
+        return cls(schema)
+
+    def _record_checked(self, marker, path, schema_hash, cls):
+        """Record a checked schema; the cache is best effort and never fails validation"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_file = f"{marker}.{os.getpid()}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump({
+                    'schema_hash': schema_hash,
+                    'schema_file': path,
+                    'dialect': cls.META_SCHEMA.get('$schema'),
+                    'checked_at': datetime.now().isoformat()
+                }, f)
+            os.replace(tmp_file, marker)
+        except OSError:
+            pass
+
+    def errors(self, policy_type, document):
+        """(path, message) for every schema violation, None when the type has no schema"""
+        validator = self.validator(policy_type)
+        if validator is None:
+            return None
+        return [(error_path(error), error.message) for error in validator.iter_errors(document)]
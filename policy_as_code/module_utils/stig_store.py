@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Fourth Estate Policy as Code Framework
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Indexed SQLite store of DISA STIG findings ingested from XCCDF and CKL files
+
+STIG XML is read with incremental iterparse and every Group or VULN element is
+detached from the tree as soon as it has been read, so memory stays bounded by
+one finding however large the benchmark, checklist or zip bundle is.
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import hashlib
+import os
+import re
+import sqlite3
+import zipfile
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from urllib.parse import quote
+
+SEVERITY_CATEGORIES = {'high': 'CAT I', 'medium': 'CAT II', 'low': 'CAT III'}
+
+STIG_EXTENSIONS = ('.xml', '.ckl', '.zip')
+
+VULN_ID = re.compile(r'V-\d+')
+
+# Findings inserted per executemany batch
+INSERT_BATCH = 1000
+
+# SQLite limits host parameters per statement
+LOOKUP_BATCH = 500
+
+# Bytes read per step when hashing a source file
+HASH_CHUNK = 1024 * 1024
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS benchmarks (
+    benchmark_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    title TEXT,
+    version TEXT,
+    release TEXT,
+    source TEXT,
+    ingested TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS findings (
+    vuln_id TEXT PRIMARY KEY,
+    benchmark_id INTEGER NOT NULL REFERENCES benchmarks (benchmark_id),
+    rule_id TEXT,
+    stig_id TEXT,
+    title TEXT,
+    severity TEXT,
+    category TEXT,
+    check_text TEXT,
+    fix_text TEXT,
+    ccis TEXT
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS findings_benchmark ON findings (benchmark_id);
+CREATE INDEX IF NOT EXISTS findings_rule ON findings (rule_id);
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    benchmarks TEXT,
+    findings INTEGER NOT NULL
+);
+'''
+
+FINDING_COLUMNS = ('vuln_id', 'rule_id', 'stig_id', 'title', 'severity', 'category', 'check_text', 'fix_text', 'ccis')
+
+class StigFormatError(Exception):
+    """File is not an XCCDF benchmark, CKL checklist or bundle of them"""
+
+def _local(tag):
+    return tag.rsplit('}', 1)[-1]
+
+def _text(element):
+    return (element.text or '').strip() if element is not None else None
+
+def _finding(vuln_id, rule_id, stig_id, title, severity, check_text, fix_text, ccis):
+    severity = (severity or '').lower() or None
+    return {
+        'vuln_id': vuln_id,
+        'rule_id': rule_id,
+        'stig_id': stig_id,
+        'title': title,
+        'severity': severity,
+        'category': SEVERITY_CATEGORIES.get(severity),
+        'check_text': check_text,
+        'fix_text': fix_text,
+        'ccis': ','.join(ccis)
+    }
+
+def _xccdf_finding(rule, group_id):
+    """Finding of an XCCDF Rule, identified by the V-ID of its Group or its own id"""
+    match = VULN_ID.search(group_id or '') or VULN_ID.search(rule.get('id', ''))
+    if match is None:
+        return None
+    fields = {}
+    ccis = []
+    for child in rule.iter():
+        name = _local(child.tag)
+        if name == 'ident' and (child.text or '').startswith('CCI-'):
+            ccis.append(child.text.strip())
+        elif name in ('version', 'title', 'fixtext', 'check-content') and name not in fields:
+            fields[name] = _text(child)
+    return _finding(match.group(0), rule.get('id'), fields.get('version'), fields.get('title'), rule.get('severity'),
+                    fields.get('check-content'), fields.get('fixtext'), ccis)
+
+def _xccdf_events(events, root):
+    """('benchmark', info) and ('finding', finding) events of an XCCDF benchmark"""
+    benchmark = {'name': root.get('id'), 'title': None, 'version': None, 'release': None}
+    announced = False
+    stack = [root]
+    group_id = None
+    for event, element in events:
+        tag = _local(element.tag)
+        if event == 'start':
+            stack.append(element)
+            if tag == 'Group':
+                group_id = element.get('id')
+            continue
+
+        stack.pop()
+        parent = _local(stack[-1].tag) if stack else None
+        if parent == 'Benchmark' and tag in ('title', 'version'):
+            benchmark[tag] = _text(element)
+        elif parent == 'Benchmark' and tag == 'plain-text' and element.get('id') == 'release-info':
+            benchmark['release'] = _text(element)
+        elif tag == 'Rule':
+            finding = _xccdf_finding(element, group_id)
+            if finding is not None:
+                if not announced:
+                    announced = True
+                    yield 'benchmark', benchmark
+                yield 'finding', finding
+
+        if tag == 'Group':
+            group_id = None
+        # Detach every top-level element (groups, profiles, values) once read
+        if stack and stack[-1] is root:
+            root.remove(element)
+
+def _ckl_events(events, root):
+    """('benchmark', info) and ('finding', finding) events of a CKL checklist, one benchmark per iSTIG"""
+    stack = [root]
+    info = {}
+    for event, element in events:
+        tag = element.tag
+        if event == 'start':
+            stack.append(element)
+            if tag == 'iSTIG':
+                info = {}
+            continue
+
+        stack.pop()
+        if tag == 'SI_DATA':
+            info[element.findtext('SID_NAME')] = element.findtext('SID_DATA')
+        elif tag == 'STIG_INFO':
+            yield 'benchmark', {
+                'name': info.get('stigid'),
+                'title': info.get('title'),
+                'version': info.get('version'),
+                'release': info.get('releaseinfo')
+            }
+        elif tag == 'VULN':
+            attributes = {}
+            ccis = []
+            for data in element.iterfind('STIG_DATA'):
+                key = data.findtext('VULN_ATTRIBUTE')
+                value = (data.findtext('ATTRIBUTE_DATA') or '').strip()
+                if key == 'CCI_REF':
+                    ccis.append(value)
+                else:
+                    attributes[key] = value
+            if attributes.get('Vuln_Num'):
+                yield 'finding', _finding(attributes['Vuln_Num'], attributes.get('Rule_ID'), attributes.get('Rule_Ver'),
+                                          attributes.get('Rule_Title'), attributes.get('Severity'),
+                                          attributes.get('Check_Content'), attributes.get('Fix_Text'), ccis)
+            stack[-1].remove(element)
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def iter_stig_events(source, name):
+    """Stream benchmark and finding events from one XCCDF or CKL document"""
+    events = ET.iterparse(source, events=('start', 'end'))
+    try:
+        _, root = next(events)
+    except (StopIteration, ET.ParseError) as e:
+        raise StigFormatError(f"{name} is not a STIG document: {str(e)}")
+
+    handlers = {'Benchmark': _xccdf_events, 'CHECKLIST': _ckl_events}
+    handler = handlers.get(_local(root.tag))
+    if handler is None:
+        raise StigFormatError(f"{name} is neither an XCCDF benchmark nor a CKL checklist")
+    try:
+        yield from handler(events, root)
+    except ET.ParseError as e:
+        raise StigFormatError(f"Failed to parse {name}: {str(e)}")
+
+def iter_stig_file(path):
+    """Stream events from an XCCDF or CKL file, or every such member of a zip bundle"""
+    if not path.lower().endswith('.zip'):
+        with open(path, 'rb') as f:
+            yield from iter_stig_events(f, path)
+        return
+
+    try:
+        bundle = zipfile.ZipFile(path)
+    except zipfile.BadZipFile as e:
+        raise StigFormatError(f"{path} is not a zip bundle: {str(e)}")
+    with bundle:
+        for member in bundle.namelist():
+            lowered = member.lower()
+            if lowered.endswith('.ckl') or (lowered.endswith('.xml') and 'xccdf' in lowered):
+                with bundle.open(member) as f:
+                    yield from iter_stig_events(f, f"{path}:{member}")
+
+class StigStore:
+    """Indexed SQLite store of STIG findings keyed by vulnerability ID"""
+
+    def __init__(self, path, timeout=30.0, read_only=False):
+        if read_only:
+            # Lookups never create the store, change its journal mode or write its schema
+            self.connection = sqlite3.connect(
+                f"file:{quote(os.path.abspath(path))}?mode=ro", uri=True, timeout=timeout, isolation_level=None
+            )
+            self.connection.row_factory = sqlite3.Row
+            return
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        self.connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def current(self, path):
+        """Recorded ingest of a source file when the file has not changed since, otherwise None"""
+        source = os.path.abspath(path)
+        stat = os.stat(path)
+        row = self.connection.execute(
+            'SELECT size, mtime_ns, sha256, benchmarks, findings FROM sources WHERE path = ?', (source,)
+        ).fetchone()
+        if row is None:
+            return None
+        if (row['size'], row['mtime_ns']) != (stat.st_size, stat.st_mtime_ns):
+            if _file_digest(path) != row['sha256']:
+                return None
+        benchmarks = row['benchmarks'].split('\n') if row['benchmarks'] else []
+        return {'source': path, 'benchmarks': benchmarks, 'findings': row['findings'], 'changed': False}
+
+    def ingest(self, path):
+        """Stream one STIG file into the store, replacing the findings of benchmarks it contains
+
+        Files whose size and modification time, or failing those content hash,
+        match their previous ingest are skipped and leave the revision unchanged.
+        """
+        source = os.path.abspath(path)
+        stat = os.stat(path)
+        unchanged = self.current(path)
+        if unchanged is not None:
+            # Touched but identical files get their new size and time recorded
+            self.connection.execute(
+                'UPDATE sources SET size = ?, mtime_ns = ? WHERE path = ?', (stat.st_size, stat.st_mtime_ns, source)
+            )
+            return unchanged
+
+        digest = _file_digest(path)
+        ingested = datetime.now().isoformat(timespec='seconds')
+        benchmarks = []
+        count = 0
+        batch = []
+        cursor = self.connection.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            benchmark_id = None
+            for kind, item in iter_stig_file(path):
+                if kind == 'benchmark':
+                    self._insert_findings(cursor, batch)
+                    batch = []
+                    benchmark_id = self._replace_benchmark(cursor, item, source, ingested)
+                    benchmarks.append(item['name'])
+                elif benchmark_id is not None:
+                    batch.append(tuple(item[column] for column in FINDING_COLUMNS) + (benchmark_id,))
+                    count += 1
+                    if len(batch) >= INSERT_BATCH:
+                        self._insert_findings(cursor, batch)
+                        batch = []
+            self._insert_findings(cursor, batch)
+            cursor.execute(
+                'INSERT OR REPLACE INTO sources (path, size, mtime_ns, sha256, benchmarks, findings) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (source, stat.st_size, stat.st_mtime_ns, digest, '\n'.join(name or '' for name in benchmarks), count)
+            )
+            revision = cursor.execute('PRAGMA user_version').fetchone()[0]
+            cursor.execute(f"PRAGMA user_version = {revision + 1}")
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+
+        return {'source': path, 'benchmarks': benchmarks, 'findings': count, 'changed': True}
+
+    def _replace_benchmark(self, cursor, benchmark, path, ingested):
+        """Upsert a benchmark and drop its previously ingested findings"""
+        name = benchmark['name'] or os.path.basename(path)
+        # A benchmark moving to another file invalidates the record of the file it came from
+        cursor.execute(
+            'DELETE FROM sources WHERE path = (SELECT source FROM benchmarks WHERE name = ? AND source != ?)',
+            (name, path)
+        )
+        cursor.execute(
+            'INSERT INTO benchmarks (name, title, version, release, source, ingested) VALUES (?, ?, ?, ?, ?, ?) '
+            'ON CONFLICT (name) DO UPDATE SET title = excluded.title, version = excluded.version, '
+            'release = excluded.release, source = excluded.source, ingested = excluded.ingested',
+            (name, benchmark['title'], benchmark['version'], benchmark['release'], path, ingested)
+        )
+        benchmark_id = cursor.execute('SELECT benchmark_id FROM benchmarks WHERE name = ?', (name,)).fetchone()[0]
+        cursor.execute('DELETE FROM findings WHERE benchmark_id = ?', (benchmark_id,))
+        return benchmark_id
+
+    def _insert_findings(self, cursor, batch):
+        if not batch:
+            return
+        columns = ', '.join(FINDING_COLUMNS)
+        updates = ', '.join(f"{column} = excluded.{column}" for column in FINDING_COLUMNS[1:])
+        cursor.executemany(
+            f"INSERT INTO findings ({columns}, benchmark_id) VALUES ({', '.join('?' * (len(FINDING_COLUMNS) + 1))}) "
+            f"ON CONFLICT (vuln_id) DO UPDATE SET {updates}, benchmark_id = excluded.benchmark_id",
+            batch
+        )
+
+    def lookup(self, vuln_ids):
+        """Findings by vulnerability ID for the given IDs; unknown IDs are absent"""
+        vuln_ids = list(dict.fromkeys(str(vuln_id).strip().upper() for vuln_id in vuln_ids))
+        findings = {}
+        for start in range(0, len(vuln_ids), LOOKUP_BATCH):
+            chunk = vuln_ids[start:start + LOOKUP_BATCH]
+            rows = self.connection.execute(
+                'SELECT f.vuln_id, f.rule_id, f.stig_id, f.title, f.severity, f.category, f.check_text, '
+                'f.fix_text, f.ccis, b.name AS benchmark '
+                'FROM findings f JOIN benchmarks b ON b.benchmark_id = f.benchmark_id '
+                f"WHERE f.vuln_id IN ({', '.join('?' * len(chunk))})",
+                chunk
+            )
+            for row in rows:
+                findings[row['vuln_id']] = dict(row, ccis=row['ccis'].split(',') if row['ccis'] else [])
+        return findings
+
+    def revision(self):
+        """Counter identifying the store's content, incremented by every ingest"""
+        return self.connection.execute('PRAGMA user_version').fetchone()[0]
+
+    def benchmarks(self):
+        """Ingested benchmarks with their finding counts"""
+        rows = self.connection.execute(
+            'SELECT b.name, b.title, b.version, b.release, b.source, b.ingested, COUNT(f.vuln_id) AS findings '
+            'FROM benchmarks b LEFT JOIN findings f ON f.benchmark_id = b.benchmark_id '
+            'GROUP BY b.benchmark_id ORDER BY b.name'
+        )
+        return [dict(row) for row in rows]
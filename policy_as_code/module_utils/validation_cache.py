@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Fourth Estate Policy as Code Framework
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""Persistent policy validation results keyed by policy content
+
+A result is stored under a hash of the policy file's bytes, the validator and
+its version, and every option that changes the outcome, so an unchanged policy
+validated with the same options is answered without parsing it again.
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+
+class ValidationCache:
+    """Validation results stored one JSON file per key below cache_dir"""
+
+    def __init__(self, cache_dir, validator, version):
+        self.cache_dir = cache_dir
+        self.validator = validator
+        self.version = version
+
+    def key(self, content, **options):
+        """Cache key of a policy's bytes validated with the given options"""
+        digest = hashlib.sha256()
+        digest.update(json.dumps([self.validator, self.version, options], sort_keys=True, default=str).encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(content)
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key):
+        """Stored result for a key, or None; an unreadable entry is a miss"""
+        try:
+            with open(self._path(key), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, result):
+        """Store a result; the cache is best effort and never fails validation"""
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_file = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(result, f, default=str)
+            os.replace(tmp_file, path)
+        except (OSError, TypeError, ValueError):
+            pass